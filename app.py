@@ -12,16 +12,16 @@ Entry point for Streamlit Cloud: app.py
 
 from __future__ import annotations
 
+import hashlib
 import json
 import os
-from dataclasses import asdict
+from dataclasses import asdict, replace
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
 
 import streamlit as st
 
-from core.modes import DEFAULT_MODES, get_mode_spec
-from core.rng import stable_int_seed
+from core.modes import DEFAULT_MODES, ModeSpec, get_mode_spec
 
 # Core imports are bootstrapped at runtime to avoid Streamlit hard-crash
 # in case the repo was partially updated.
@@ -42,6 +42,7 @@ except Exception:
             self.retry_after_s = int(retry_after_s or 0)
 
 from content.providers.base import ProviderStatus
+from content.schemas import draft_from_llm
 
 from engine.config import EngineConfig
 from engine.pipeline import apply_choice, apply_option_spec, draft_to_bundle, intent_to_option_spec
@@ -89,31 +90,36 @@ hr.soft {border: none; border-top: 1px solid rgba(255,255,255,0.08); margin: 1re
 
 st.markdown(CSS, unsafe_allow_html=True)
 
+# st.fragment reruns only the decorated block on widget interaction (Streamlit >= 1.37;
+# older releases ship it as experimental_fragment). Without it, panels render as plain calls.
+_fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None) or (lambda f: f)
 
-def bootstrap_core_or_stop() -> None:
-    """Import core API lazily and stop with a helpful message if repo is inconsistent."""
-    global DelayedEffect, GameState, Stats, stats_to_dict, default_start_state
 
+@st.cache_resource(show_spinner=False)
+def _bootstrap_once() -> Tuple[Any, Any, Any, Any, Any]:
+    """Import and validate the core API once per process.
+
+    Raises RuntimeError with a user-facing message. Exceptions are not cached,
+    so a fixed deploy recovers on the next rerun.
+    """
     try:
         import core  # noqa: F401
         from core.state import DelayedEffect as _DelayedEffect, GameState as _GameState, Stats as _Stats
         from core.state import stats_to_dict as _stats_to_dict, default_start_state as _default_start_state
     except Exception as e:
-        st.error(
+        raise RuntimeError(
             "Core modülleri yüklenemedi (repo kısmi güncellenmiş olabilir).\n\n"
             "Çözüm: Zip içindeki TÜM dosyaları repo köküne overwrite edip tekrar deploy et.\n\n"
             f"Hata: {type(e).__name__}: {e}"
-        )
-        st.stop()
+        ) from e
 
     api_ver = getattr(__import__("core"), "API_VERSION", None)
     if api_ver != "core-v10-20260219":
-        st.error(
+        raise RuntimeError(
             "Core sürümü ile app sürümü uyuşmuyor (repo karışmış olabilir).\n\n"
             "Çözüm: Zip içindeki TÜM dosyaları overwrite edip deploy et.\n\n"
             f"Beklenen core: core-v10-20260219, bulunan: {api_ver!r}"
         )
-        st.stop()
 
     # Validate expected Stats fields (dataclass fields live on instances, not the class).
     fields = set()
@@ -123,7 +129,7 @@ def bootstrap_core_or_stop() -> None:
     missing = [k for k in ('morale', 'tech_debt') if k not in fields]
     if missing:
         import core.state as _cs
-        st.error(
+        raise RuntimeError(
             "Core Stats alanları eksik görünüyor (morale/tech_debt).\n\n"
             "Bu genelde repo kısmi güncellendiğinde veya yanlış 'core' paketi import edildiğinde olur.\n\n"
             f"Yüklenen core.state yolu: {_cs.__file__}\n"
@@ -131,10 +137,21 @@ def bootstrap_core_or_stop() -> None:
             f"Eksik: {missing}\n\n"
             "Çözüm: Zip içindeki TÜM dosyaları repo köküne overwrite edip tekrar deploy et (ve Cloud'da Reboot/Clear cache)."
         )
+
+    return _DelayedEffect, _GameState, _Stats, _stats_to_dict, _default_start_state
+
+
+def bootstrap_core_or_stop() -> None:
+    """Bind the core API (validated once per process) or stop with a helpful message."""
+    global DelayedEffect, GameState, Stats, stats_to_dict, default_start_state
+
+    try:
+        api = _bootstrap_once()
+    except RuntimeError as e:
+        st.error(str(e))
         st.stop()
 
-    DelayedEffect, GameState, Stats = _DelayedEffect, _GameState, _Stats
-    stats_to_dict, default_start_state = _stats_to_dict, _default_start_state
+    DelayedEffect, GameState, Stats, stats_to_dict, default_start_state = api
 
 
 bootstrap_core_or_stop()
@@ -214,6 +231,12 @@ CASES: Dict[str, Dict[str, Any]] = {
 }
 
 
+# Sidebar option lists (fixed at import time; the sidebar renders on every rerun).
+_MODE_NAMES = tuple(DEFAULT_MODES)
+_CASE_KEYS = tuple(CASES)
+_CHAR_KEYS = tuple(CHARACTERS)
+
+
 DEFAULT_EXPENSES = {
     "payroll": 90_000.0,
     "tools": 10_000.0,
@@ -298,37 +321,82 @@ def _get_api_keys() -> tuple[List[str], str]:
     return [], "missing"
 
 
+def _keys_signature(keys: List[str]) -> str:
+    """Stable cache key for a key pool (sha256, so secrets never appear in cache keys)."""
+    return hashlib.sha256("|".join(keys).encode("utf-8")).hexdigest()
+
+
+@st.cache_resource(show_spinner=False)
+def _shared_provider(keys_sig: str, _keys: Tuple[str, ...]) -> GeminiProvider:
+    """Build the provider (and its SDK client) once per process and key pool.
+
+    Only the signature is hashed; rotating secrets yields a new signature and
+    therefore a fresh provider.
+    """
+    return GeminiProvider(list(_keys))
+
+
 def _provider() -> GeminiProvider:
-    """Session-cached provider.
+    """Process-cached provider shared by all sessions.
 
     Important: If we created a new provider instance on every call, key rotation
-    would never persist and a key pool would be useless. We therefore keep a
-    provider per Streamlit session and distribute load round-robin.
+    would never persist and a key pool would be useless. A single shared instance
+    keeps the client warm and its round-robin rotation spreads load across users.
     """
     keys, _src = _get_api_keys()
-    sig = "|".join(keys)
-
-    # Make a session nonce so different users don't all start from key #0.
-    if "_session_nonce" not in st.session_state:
-        st.session_state["_session_nonce"] = os.urandom(8).hex()
-
-    cached_sig = st.session_state.get("_gemini_keys_sig")
-    if st.session_state.get("_gemini_provider") is None or cached_sig != sig:
-        # Pick a deterministic offset per user session to spread traffic.
-        if keys:
-            off = stable_int_seed(f"keypool:{st.session_state['_session_nonce']}") % max(1, len(keys))
-            keys = keys[off:] + keys[:off]
-        st.session_state["_gemini_provider"] = GeminiProvider(keys)
-        st.session_state["_gemini_keys_sig"] = sig
-
-    return st.session_state["_gemini_provider"]
+    return _shared_provider(_keys_signature(keys), tuple(keys))
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_provider_status(keys_sig: str) -> Dict[str, Any]:
+    """Provider status as a plain dict; refreshed at most every 30s per key pool."""
+    return asdict(_provider().status())
+
+
 def _provider_status() -> ProviderStatus:
     try:
-        return _provider().status()
+        keys, _src = _get_api_keys()
+        return ProviderStatus(**_cached_provider_status(_keys_signature(keys)))
     except Exception as e:
         return ProviderStatus(False, "none", "", note="", error=str(e))
 
 
+def _asdict_cached(obj: Any) -> Dict[str, Any]:
+    """asdict() memoized per object identity for this session.
+
+    EngineConfig/GameState are replaced, never mutated, so the same object means
+    the same dict. The memo holds a reference to the object, so its id cannot be
+    reused while cached. Callers must treat the result as read-only.
+    """
+    memo = st.session_state.setdefault("_asdict_memo", {})
+    key = type(obj).__name__
+    hit = memo.get(key)
+    if hit is not None and hit[0] is obj:
+        return hit[1]
+    d = asdict(obj)
+    memo[key] = (obj, d)
+    return d
+
+
+def _json_text(obj: Any) -> str:
+    """JSON text for st.json, memoized per object identity for this session.
+
+    Logged bundles and state snapshots are never mutated once stored, so each is
+    serialized once instead of on every page rerun. Objects with to_dict()
+    (e.g. MonthBundle) are serialized through it.
+    """
+    memo = st.session_state.setdefault("_json_memo", {})
+    hit = memo.get(id(obj))
+    if hit is not None and hit[0] is obj:
+        return hit[1]
+    if len(memo) > 256:
+        memo.clear()
+    data = obj.to_dict() if hasattr(obj, "to_dict") else obj
+    text = json.dumps(data, ensure_ascii=False, default=repr)
+    memo[id(obj)] = (obj, text)
+    return text
+
+
 def _stat_badge(val: float, lo: float, hi: float) -> str:
     if val <= lo:
         return "bad"
@@ -343,6 +411,10 @@ def _runway_months(cash: float, burn: float) -> float:
     return max(0.0, cash / burn)
 
 
+# Weights for (runway, churn, support, infra, tech debt, morale) in _tension_index.
+_TENSION_WEIGHTS = (0.36, 0.20, 0.14, 0.14, 0.10, 0.06)
+
+
 def _tension_index(stats: Dict[str, float], burn: float) -> float:
     """0..1 (higher = more tension). Pure UI metric."""
     cash = float(stats.get("cash", 0.0))
@@ -353,33 +425,37 @@ def _tension_index(stats: Dict[str, float], burn: float) -> float:
     morale = float(stats.get("morale", 55.0))
 
     runway = _runway_months(cash, burn)
-    a = 1.0 - min(1.0, runway / 10.0)  # <10 months runway = tension
-    b = min(1.0, max(0.0, (churn - 0.04) / 0.10))
-    c = min(1.0, max(0.0, (support - 35.0) / 60.0))
-    d = min(1.0, max(0.0, (infra - 35.0) / 60.0))
-    e = min(1.0, max(0.0, (tech - 30.0) / 70.0))
-    f = 1.0 - min(1.0, max(0.0, morale / 100.0))  # low morale => higher tension
-    return max(0.0, min(1.0, 0.36 * a + 0.20 * b + 0.14 * c + 0.14 * d + 0.10 * e + 0.06 * f))
+    terms = (
+        1.0 - min(1.0, runway / 10.0),  # <10 months runway = tension
+        min(1.0, max(0.0, (churn - 0.04) / 0.10)),
+        min(1.0, max(0.0, (support - 35.0) / 60.0)),
+        min(1.0, max(0.0, (infra - 35.0) / 60.0)),
+        min(1.0, max(0.0, (tech - 30.0) / 70.0)),
+        1.0 - min(1.0, max(0.0, morale / 100.0)),  # low morale => higher tension
+    )
+    return max(0.0, min(1.0, sum(w * x for w, x in zip(_TENSION_WEIGHTS, terms))))
+
+
+_DELTA_KEYS = (
+    ("mrr", "MRR ↑", "MRR ↓"),
+    ("cash", "Nakit ↑", "Nakit ↓"),
+    ("reputation", "İtibar ↑", "İtibar ↓"),
+    ("churn", "Churn ↑", "Churn ↓"),
+    ("support_load", "Destek yükü ↑", "Destek yükü ↓"),
+    ("infra_load", "Altyapı yükü ↑", "Altyapı yükü ↓"),
+    ("morale", "Moral ↑", "Moral ↓"),
+    ("tech_debt", "Tech Debt ↑", "Tech Debt ↓"),
+)
 
 
 def _delta_summary(delta: Dict[str, float]) -> str:
     """Human summary, no fancy numbers."""
     parts: List[str] = []
-    def add(k: str, up: str, down: str) -> None:
+    for k, up, down in _DELTA_KEYS:
         v = float(delta.get(k, 0.0))
-        if abs(v) < 1e-9:
-            return
-        parts.append(up if v > 0 else down)
-
-    add("mrr", "MRR ↑", "MRR ↓")
-    add("cash", "Nakit ↑", "Nakit ↓")
-    add("reputation", "İtibar ↑", "İtibar ↓")
-    add("churn", "Churn ↑", "Churn ↓")
-    add("support_load", "Destek yükü ↑", "Destek yükü ↓")
-    add("infra_load", "Altyapı yükü ↑", "Altyapı yükü ↓")
-    add("morale", "Moral ↑", "Moral ↓")
-    add("tech_debt", "Tech Debt ↑", "Tech Debt ↓")
-    return " · ".join(parts) if parts else "Denge" 
+        if abs(v) >= 1e-9:
+            parts.append(up if v > 0 else down)
+    return " · ".join(parts) if parts else "Denge"
 
 
 # =========================
@@ -422,6 +498,8 @@ def _ensure_state() -> None:
 
     if "logs" not in ss:
         ss.logs = []
+    if "bundles" not in ss:
+        ss.bundles = {}
     if "history" not in ss:
         ss.history = []
     if "last_outcome" not in ss:
@@ -432,6 +510,8 @@ def _reset_run() -> None:
     ss = st.session_state
     keep = {
         "player_name": ss.get("player_name", ""),
+        # a file still sitting in the uploader must not be re-imported after reset
+        "last_import_hash": ss.get("last_import_hash"),
     }
     for k in list(ss.keys()):
         del ss[k]
@@ -447,16 +527,19 @@ def _start_run() -> None:
     char = CHARACTERS.get(ss.character_key, CHARACTERS["anon"])
 
     base = default_start_state()
-    # character starting overrides
-    sdict = stats_to_dict(base.stats)
+    # character starting overrides (only the touched fields are rebuilt)
+    known = stats_to_dict(base.stats)
+    overrides: Dict[str, float] = {}
     for k, v in dict(char.get("start_overrides", {}) or {}).items():
+        if str(k) not in known:
+            continue
         try:
-            sdict[str(k)] = float(v)
+            overrides[str(k)] = float(v)
         except Exception:
             continue
     state = GameState(
         month=1,
-        stats=Stats(**sdict),
+        stats=replace(base.stats, **overrides),
         delayed_queue=[],
     )
 
@@ -476,6 +559,7 @@ def _start_run() -> None:
     ss.current_draft = None
     ss.current_raw = ""
     ss.logs = []
+    ss.bundles = {}
     ss.history = []
     ss.last_outcome = ""
 
@@ -485,7 +569,69 @@ def _start_run() -> None:
 # =========================
 
 
-def _generate_month_bundle() -> None:
+@st.cache_data(max_entries=512, show_spinner=False)
+def _build_prompt_cached(
+    month: int,
+    mode_title: str,
+    mode_desc: str,
+    mode_tone: str,
+    idea: str,
+    recent_tags: Tuple[str, ...],
+    case_title: str,
+    case_blurb: str,
+    stats_items: Tuple[Tuple[str, float], ...],
+    character_name: str,
+    character_trait: str,
+) -> str:
+    """build_prompt memoized on a hashable view of its inputs.
+
+    Only the last four history tags reach the prompt, so that is all we key on.
+    """
+    return build_prompt(
+        month=month,
+        mode_title=mode_title,
+        mode_desc=mode_desc,
+        mode_tone=mode_tone,
+        idea=idea,
+        history=[{"tag": t} for t in recent_tags],
+        case_title=case_title,
+        case_blurb=case_blurb,
+        stats=dict(stats_items),
+        character_name=character_name,
+        character_trait=character_trait,
+    )
+
+
+@st.cache_data(max_entries=2000, persist="disk", show_spinner=False)
+def _cached_month_draft(
+    _provider: GeminiProvider, prompt: str, temperature: float, month_id: int, attempt: int = 0
+) -> Tuple[Dict[str, Any], str]:
+    """Generate a month draft once per (prompt, temperature, month).
+
+    The prompt already encodes every deterministic input (month, stats, history,
+    idea, case, character, mode), so a rerun or a retry after an unrelated error
+    reuses the stored draft instead of spending another Gemini call.
+    The provider is excluded from the cache key (leading underscore).
+
+    Entries are persisted to disk so they survive process restarts
+    (Streamlit ignores ttl for disk-persisted caches, hence none is set).
+    A draft that does not load back through draft_from_llm raises instead of
+    being stored. `attempt` only varies the cache key: bumping it regenerates
+    this one entry without touching the rest of the cache.
+    """
+    draft, raw = _provider.generate_month_draft(
+        month_id=int(month_id),
+        prompt=prompt,
+        temperature=float(temperature),
+        max_output_tokens=2600,
+        repair_on_fail=True,
+    )
+    data = draft.to_dict()
+    draft_from_llm(data, month_id=int(month_id))
+    return data, raw
+
+
+def _generate_month_bundle(mode: ModeSpec, case: Dict[str, Any], char: Dict[str, Any]) -> None:
     ss = st.session_state
     cfg: EngineConfig = ss.engine_config
     state: GameState = ss.game_state
@@ -497,34 +643,31 @@ def _generate_month_bundle() -> None:
     if not stt.ok:
         raise RuntimeError(f"Gemini hazır değil: {stt.error or 'API key?'}")
 
-    mode = get_mode_spec(cfg.mode_key)
-    case = CASES.get(ss.case_key, CASES["free"])
-    char = CHARACTERS.get(ss.character_key, CHARACTERS["anon"])
-
-    prompt = build_prompt(
-        month=int(state.month),
-        mode_title=mode.key,
-        mode_desc=mode.desc,
-        mode_tone=mode.tone,
-        idea=str(ss.idea),
-        history=list(ss.history),
-        case_title=str(case["title"]),
-        case_blurb=str(case["blurb"]),
-        stats=stats_to_dict(state.stats),
-        character_name=str(char["name"]),
-        character_trait=str(char["trait"]),
+    prompt = _build_prompt_cached(
+        int(state.month),
+        mode.key,
+        mode.desc,
+        mode.tone,
+        str(ss.idea),
+        tuple(str(h.get("tag", "")) for h in ss.history[-4:]),
+        str(case["title"]),
+        str(case["blurb"]),
+        tuple(stats_to_dict(state.stats).items()),
+        str(char["name"]),
+        str(char["trait"]),
     )
 
     # We cannot fully guarantee determinism with an LLM.
     # But we store the returned draft/bundle so the run is stable after generation.
 
-    draft, raw = provider.generate_month_draft(
-        month_id=int(state.month),
-        prompt=prompt,
-        temperature=float(mode.temp),
-        max_output_tokens=2600,
-        repair_on_fail=True,
-    )
+    draft_dict, raw = _cached_month_draft(provider, prompt, float(mode.temp), int(state.month))
+    try:
+        draft = draft_from_llm(draft_dict, month_id=int(state.month))
+    except Exception:
+        # A persisted entry from an older build no longer validates: regenerate under a
+        # fresh key for this prompt only (the rest of the shared cache stays intact).
+        draft_dict, raw = _cached_month_draft(provider, prompt, float(mode.temp), int(state.month), attempt=1)
+        draft = draft_from_llm(draft_dict, month_id=int(state.month))
 
     bundle = draft_to_bundle(draft, cfg)
 
@@ -569,7 +712,7 @@ def page_run() -> None:
 
     # metrics row
     stats = stats_to_dict(state.stats)
-    burn = float(sum(cfg.expenses.values()))
+    burn = cfg.expenses_total
     runway = _runway_months(float(stats.get("cash", 0.0)), burn)
     tension = _tension_index(stats, burn)
 
@@ -609,7 +752,11 @@ def page_run() -> None:
     # generate month
     if ss.current_bundle is None:
         with st.spinner("Bu ayın paketi hazırlanıyor (Gemini)…"):
-            _generate_month_bundle()
+            _generate_month_bundle(
+                get_mode_spec(cfg.mode_key),
+                CASES.get(ss.case_key, CASES["free"]),
+                CHARACTERS.get(ss.character_key, CHARACTERS["anon"]),
+            )
 
     bundle = ss.current_bundle
 
@@ -639,130 +786,166 @@ def page_run() -> None:
 
     st.markdown("<hr class='soft'/>", unsafe_allow_html=True)
 
-    # --- Callbacks ---
-    def _on_choose(choice_id: str) -> None:
-        ss = st.session_state
-        cfg: EngineConfig = ss.engine_config
-        state: GameState = ss.game_state
-        bundle = ss.current_bundle
-
-        new_state, log = apply_choice(state=state, bundle=bundle, choice_id=choice_id, config=cfg)
-
-        # outcome narrative
-        opt = next(o for o in bundle.options if str(o.id) == str(choice_id))
-        outcome = ""
-        if opt.narrative_result:
-            outcome += opt.narrative_result.strip() + "\n\n"
-
-        # due effects shown as flavour
-        due = log.get("due_effects") or []
-        if due:
-            outcome += "**Gecikmeli etkiler bu ay vurdu:**\n"
-            for ev in due:
-                outcome += f"- {ev.get('hint','Gecikmeli etki')} (Ay {ev.get('from_month')})\n"
-            outcome += "\n"
-
-        if getattr(bundle, "lesson", ""):
-            outcome += f"---\n**Bu ayın dersi:** {bundle.lesson.strip()}\n\n"
-
-        # cliffhanger
-        if bundle.cliffhanger:
-            outcome += f"---\n*{bundle.cliffhanger.strip()}*"
-
-        # store history + logs
-        ss.logs.append({
-            "month": int(log.get("month", state.month)),
-            "choice": str(choice_id),
-            "choice_label": str(log.get("choice_label", "")),
-            "bundle": bundle.to_dict(),
-            "log": {**log, "player_plan": str(ss.get("player_plan","")).strip()},
-        })
-        chosen_tag = str(getattr(opt, "tag", "") or opt.label)
-        ss.history.append({"month": int(log.get("month", state.month)), "tag": str(chosen_tag), "choice": str(choice_id)})
-
-        ss.game_state = new_state
-        ss.current_bundle = None
-        ss.current_draft = None
-        ss.current_raw = ""
-        ss.player_plan = ""
-        ss.last_outcome = outcome
+    _render_choices()
 
-        st.rerun()
+    st.markdown("<hr class='soft'/>", unsafe_allow_html=True)
+
+    _render_player_plan()
+
+
+def _store_bundle(bundle: Any) -> str:
+    """Store the bundle dict once per month and return its ref for log entries.
+
+    A NOTE and the final choice of the same month share one entry; a regenerated
+    bundle for an already-logged month gets a suffixed ref.
+    """
+    ss = st.session_state
+    d = bundle.to_dict()
+    ref = str(bundle.month_id)
+    n = 1
+    while ref in ss.bundles and ss.bundles[ref] != d:
+        n += 1
+        ref = f"{bundle.month_id}.{n}"
+    ss.bundles[ref] = d
+    return ref
+
+
+# --- Decision callbacks ---
+
+
+def _on_choose(choice_id: str) -> None:
+    ss = st.session_state
+    cfg: EngineConfig = ss.engine_config
+    state: GameState = ss.game_state
+    bundle = ss.current_bundle
 
-    def _on_apply_player_plan() -> None:
-        ss = st.session_state
-        cfg: EngineConfig = ss.engine_config
-        state: GameState = ss.game_state
-        bundle = ss.current_bundle
-
-        txt = str(ss.get("player_plan", "") or "").strip()
-        if len(txt) < 25:
-            raise ValueError("Plan çok kısa. En az 1-2 paragraf yaz (>=25 karakter).")
-
-        provider = _provider()
-        stt = provider.status()
-        ss.provider_status = asdict(stt)
-        if not stt.ok:
-            raise RuntimeError(f"Gemini hazır değil: {stt.error or 'API key?'}")
-
-        mode = get_mode_spec(cfg.mode_key)
-
-        prompt2 = build_choice_intent_prompt(
-            month=int(state.month),
-            mode_title=mode.key,
-            mode_tone=mode.tone,
-            idea=str(ss.idea),
-            crisis_title=str(bundle.crisis_title),
-            crisis=str(bundle.crisis),
-            player_text=txt,
+    new_state, log = apply_choice(state=state, bundle=bundle, choice_id=choice_id, config=cfg)
+
+    # outcome narrative
+    opt = next(o for o in bundle.options if str(o.id) == str(choice_id))
+    outcome = ""
+    if opt.narrative_result:
+        outcome += opt.narrative_result.strip() + "\n\n"
+
+    # due effects shown as flavour
+    due = log.get("due_effects") or []
+    if due:
+        outcome += "**Gecikmeli etkiler bu ay vurdu:**\n"
+        for ev in due:
+            outcome += f"- {ev.get('hint','Gecikmeli etki')} (Ay {ev.get('from_month')})\n"
+        outcome += "\n"
+
+    if getattr(bundle, "lesson", ""):
+        outcome += f"---\n**Bu ayın dersi:** {bundle.lesson.strip()}\n\n"
+
+    # cliffhanger
+    if bundle.cliffhanger:
+        outcome += f"---\n*{bundle.cliffhanger.strip()}*"
+
+    # store history + logs
+    ss.logs.append({
+        "month": int(log.get("month", state.month)),
+        "choice": str(choice_id),
+        "choice_label": str(log.get("choice_label", "")),
+        "bundle_ref": _store_bundle(bundle),
+        "log": {**log, "player_plan": str(ss.get("player_plan","")).strip()},
+    })
+    chosen_tag = str(getattr(opt, "tag", "") or opt.label)
+    ss.history.append({"month": int(log.get("month", state.month)), "tag": str(chosen_tag), "choice": str(choice_id)})
+
+    ss.game_state = new_state
+    ss.current_bundle = None
+    ss.current_draft = None
+    ss.current_raw = ""
+    ss.player_plan = ""
+    ss.last_outcome = outcome
+
+    st.rerun()
+
+
+def _on_apply_player_plan() -> None:
+    ss = st.session_state
+    cfg: EngineConfig = ss.engine_config
+    state: GameState = ss.game_state
+    bundle = ss.current_bundle
+
+    txt = str(ss.get("player_plan", "") or "").strip()
+    if len(txt) < 25:
+        raise ValueError("Plan çok kısa. En az 1-2 paragraf yaz (>=25 karakter).")
+
+    provider = _provider()
+    stt = provider.status()
+    ss.provider_status = asdict(stt)
+    if not stt.ok:
+        raise RuntimeError(f"Gemini hazır değil: {stt.error or 'API key?'}")
+
+    mode = get_mode_spec(cfg.mode_key)
+
+    prompt2 = build_choice_intent_prompt(
+        month=int(state.month),
+        mode_title=mode.key,
+        mode_tone=mode.tone,
+        idea=str(ss.idea),
+        crisis_title=str(bundle.crisis_title),
+        crisis=str(bundle.crisis),
+        player_text=txt,
+    )
+
+    with st.spinner("Planın değerlendiriliyor (Gemini)…"):
+        intent, raw_intent = provider.generate_choice_intent(
+            prompt=prompt2,
+            temperature=max(0.2, float(mode.temp) * 0.6),
         )
 
-        with st.spinner("Planın değerlendiriliyor (Gemini)…"):
-            intent, raw_intent = provider.generate_choice_intent(
-                prompt=prompt2,
-                temperature=max(0.2, float(mode.temp) * 0.6),
-            )
+    opt_spec = intent_to_option_spec(intent=intent, month_id=int(bundle.month_id), config=cfg, choice_id="YOU")
 
-        opt_spec = intent_to_option_spec(intent=intent, month_id=int(bundle.month_id), config=cfg, choice_id="YOU")
+    new_state, log = apply_option_spec(state=state, option=opt_spec, month_id=int(bundle.month_id), config=cfg)
 
-        new_state, log = apply_option_spec(state=state, option=opt_spec, month_id=int(bundle.month_id), config=cfg)
+    outcome = ""
+    if opt_spec.narrative_result:
+        outcome += opt_spec.narrative_result.strip() + "\n\n"
 
-        outcome = ""
-        if opt_spec.narrative_result:
-            outcome += opt_spec.narrative_result.strip() + "\n\n"
+    due = log.get("due_effects") or []
+    if due:
+        outcome += "**Gecikmeli etkiler bu ay vurdu:**\n"
+        for ev in due:
+            outcome += f"- {ev.get('hint','Gecikmeli etki')} (Ay {ev.get('from_month')})\n"
+        outcome += "\n"
 
-        due = log.get("due_effects") or []
-        if due:
-            outcome += "**Gecikmeli etkiler bu ay vurdu:**\n"
-            for ev in due:
-                outcome += f"- {ev.get('hint','Gecikmeli etki')} (Ay {ev.get('from_month')})\n"
-            outcome += "\n"
+    if getattr(bundle, "lesson", ""):
+        outcome += f"---\n**Bu ayın dersi:** {bundle.lesson.strip()}\n\n"
 
-        if getattr(bundle, "lesson", ""):
-            outcome += f"---\n**Bu ayın dersi:** {bundle.lesson.strip()}\n\n"
+    if bundle.cliffhanger:
+        outcome += f"---\n*{bundle.cliffhanger.strip()}*"
 
-        if bundle.cliffhanger:
-            outcome += f"---\n*{bundle.cliffhanger.strip()}*"
+    ss.logs.append({
+        "month": int(log.get("month", state.month)),
+        "choice": "YOU",
+        "choice_label": opt_spec.label,
+        "bundle_ref": _store_bundle(bundle),
+        "log": {**log, "player_text": txt, "intent": intent.to_dict(), "intent_raw": raw_intent},
+    })
+    ss.history.append({"month": int(log.get("month", state.month)), "tag": str(opt_spec.tag), "choice": "YOU"})
 
-        ss.logs.append({
-            "month": int(log.get("month", state.month)),
-            "choice": "YOU",
-            "choice_label": opt_spec.label,
-            "bundle": bundle.to_dict(),
-            "log": {**log, "player_text": txt, "intent": intent.to_dict(), "intent_raw": raw_intent},
-        })
-        ss.history.append({"month": int(log.get("month", state.month)), "tag": str(opt_spec.tag), "choice": "YOU"})
+    ss.game_state = new_state
+    ss.current_bundle = None
+    ss.current_draft = None
+    ss.current_raw = ""
+    ss.player_plan = ""
+    ss.last_outcome = outcome
 
-        ss.game_state = new_state
-        ss.current_bundle = None
-        ss.current_draft = None
-        ss.current_raw = ""
-        ss.player_plan = ""
-        ss.last_outcome = outcome
+    st.rerun()
 
-        st.rerun()
 
-    # --- Choices UI ---
+
+@_fragment
+def _render_choices() -> None:
+    """Option cards. Runs as a fragment: clicks only rerun this block (a choice then reruns the app)."""
+    ss = st.session_state
+    bundle = ss.current_bundle
+    if bundle is None:
+        return
+
     st.markdown(f"### Ay {bundle.month_id}: Kararını ver")
     cols = st.columns(len(bundle.options)) if 2 <= len(bundle.options) <= 3 else st.columns(2)
 
@@ -782,16 +965,26 @@ def page_run() -> None:
             st.markdown("\n" + str(opt.description))
 
             if st.button(f"{opt.id} seç", key=f"choose_{bundle.month_id}_{opt.id}", use_container_width=True):
-                _on_choose(str(opt.id))
+                try:
+                    _on_choose(str(opt.id))
+                except Exception as e:
+                    _show_run_error(e)
 
             st.markdown("</div>", unsafe_allow_html=True)
 
     for i, opt in enumerate(list(bundle.options)[:3]):
         render_option(cols[i], opt)
 
-    st.markdown("<hr class='soft'/>", unsafe_allow_html=True)
 
-    # --- Player plan ---
+@_fragment
+def _render_player_plan() -> None:
+    """Free-text plan panel. Runs as a fragment so typing does not rerun the whole page."""
+    ss = st.session_state
+    bundle = ss.current_bundle
+    state: GameState = ss.game_state
+    if bundle is None:
+        return
+
     st.markdown("### ✍️ Kendi çözümün (oyuna dahil et)")
     ss.player_plan = st.text_area(
         "Bu kriz için sen ne yaparsın? (1-2 paragraf yaz; istersen maddeler halinde)",
@@ -801,14 +994,17 @@ def page_run() -> None:
     c1, c2 = st.columns([1.0, 1.0])
     with c1:
         if st.button("Bu planı uygula", key=f"apply_player_{bundle.month_id}", use_container_width=True):
-            _on_apply_player_plan()
+            try:
+                _on_apply_player_plan()
+            except Exception as e:
+                _show_run_error(e)
     with c2:
         if st.button("Sadece not et (oyun ilerlemesin)", key=f"note_player_{bundle.month_id}", use_container_width=True):
             ss.logs.append({
                 "month": int(state.month),
                 "choice": "NOTE",
                 "choice_label": "Oyuncu notu",
-                "bundle": bundle.to_dict(),
+                "bundle_ref": _store_bundle(bundle),
                 "log": {"note_only": True},
                 "note": str(ss.get("player_plan","")).strip(),
             })
@@ -836,7 +1032,7 @@ def page_history() -> None:
         if note:
             st.markdown(f"**Notun:** {note}")
         st.markdown("<details><summary>Bundle (JSON)</summary>")
-        st.json(item.get("bundle"))
+        st.json(_json_text(item.get("bundle") or ss.bundles.get(str(item.get("bundle_ref")))))
         st.markdown("</details>")
         st.markdown("</div>", unsafe_allow_html=True)
         st.write("")
@@ -850,17 +1046,61 @@ def page_debug() -> None:
     st.json(ss.get("provider_status") or asdict(_provider_status()))
 
     st.subheader("EngineConfig")
-    st.json(asdict(ss.engine_config) if ss.engine_config else {})
+    st.json(_json_text(_asdict_cached(ss.engine_config)) if ss.engine_config else {})
 
     st.subheader("GameState")
-    st.json(asdict(ss.game_state) if ss.game_state else {})
+    st.json(_json_text(_asdict_cached(ss.game_state)) if ss.game_state else {})
 
     st.subheader("Last raw model output")
     st.code(ss.get("current_raw", "") or "", language="json")
 
     st.subheader("Last bundle")
     if ss.get("current_bundle"):
-        st.json(ss.current_bundle.to_dict())
+        st.json(_json_text(ss.current_bundle))
+
+
+def _export_bytes(ss: Any, setup: Dict[str, Any]) -> bytes:
+    """Serialized run export.
+
+    The run body (config, state, logs, bundles, history) is serialized once per
+    (run id, log count, month, setup) and memoized in this session's state, so
+    sidebar reruns reuse it instead of re-serializing every logged bundle. The
+    meta block is stamped on every call, so exported_at is always current.
+    """
+    gs = ss.get("game_state")
+    key = (
+        str(ss.get("run_id", "run")),
+        len(ss.get("logs", [])),
+        int(gs.month) if gs is not None else 0,
+        json.dumps(setup, ensure_ascii=False, sort_keys=True, default=str),
+    )
+    memo = ss.get("_export_memo")
+    if memo is None or memo[0] != key:
+        body = {
+            "setup": setup,
+            "engine_config": _asdict_cached(ss.engine_config) if ss.get("engine_config") else None,
+            "game_state": _asdict_cached(gs) if gs is not None else None,
+            "logs": ss.get("logs", []),
+            "bundles": ss.get("bundles", {}),
+            "history": ss.get("history", []),
+        }
+        memo = (key, json.dumps(body, ensure_ascii=False, indent=2))
+        ss["_export_memo"] = memo
+
+    head = json.dumps(
+        {
+            "meta": {
+                "app": APP_TITLE,
+                "version": APP_VERSION,
+                "build": BUILD_ID,
+                "exported_at": datetime.utcnow().isoformat() + "Z",
+            }
+        },
+        ensure_ascii=False,
+        indent=2,
+    )
+    # Splice the two documents: same text as dumping {"meta": ..., **body} at once.
+    return (head[:-2] + ",\n" + memo[1][2:]).encode("utf-8")
 
 
 def export_import_controls() -> None:
@@ -868,84 +1108,86 @@ def export_import_controls() -> None:
     st.sidebar.markdown("---")
     st.sidebar.markdown("### Run Export / Import")
 
-    export_payload = {
-        "meta": {
-            "app": APP_TITLE,
-            "version": APP_VERSION,
-            "build": BUILD_ID,
-            "exported_at": datetime.utcnow().isoformat() + "Z",
-        },
-        "setup": {
-            "player_name": ss.get("player_name"),
-            "idea": ss.get("idea"),
-            "mode_key": ss.get("mode_key"),
-            "character_key": ss.get("character_key"),
-            "case_key": ss.get("case_key"),
-            "season_len": ss.get("season_len"),
-            "base_seed": ss.get("base_seed"),
-        },
-        "engine_config": asdict(ss.engine_config) if ss.get("engine_config") else None,
-        "game_state": asdict(ss.game_state) if ss.get("game_state") else None,
-        "logs": ss.get("logs", []),
-        "history": ss.get("history", []),
+    export_setup = {
+        "player_name": ss.get("player_name"),
+        "idea": ss.get("idea"),
+        "mode_key": ss.get("mode_key"),
+        "character_key": ss.get("character_key"),
+        "case_key": ss.get("case_key"),
+        "season_len": ss.get("season_len"),
+        "base_seed": ss.get("base_seed"),
     }
+    started = bool(ss.get("started"))
+    export_data = _export_bytes(ss, export_setup) if started else b""
 
     st.sidebar.download_button(
         "Run dosyasını indir",
-        data=json.dumps(export_payload, ensure_ascii=False, indent=2).encode("utf-8"),
+        data=export_data,
         file_name=f"startup_survivor_run_{ss.get('run_id','run')}.json",
         mime="application/json",
-        disabled=not bool(ss.get("started")),
+        disabled=not started,
     )
 
     up = st.sidebar.file_uploader("Run dosyası yükle", type=["json"], accept_multiple_files=False)
-    if up is not None:
-        try:
-            data = json.loads(up.read().decode("utf-8"))
-            setup = data.get("setup") or {}
-            ss.player_name = setup.get("player_name", ss.get("player_name", ""))
-            ss.idea = setup.get("idea", "")
-            ss.mode_key = setup.get("mode_key", "Gerçekçi")
-            ss.character_key = setup.get("character_key", "anon")
-            ss.case_key = setup.get("case_key", "free")
-            ss.season_len = int(setup.get("season_len", 12))
-            ss.base_seed = int(setup.get("base_seed", 42))
-
-            cfg = data.get("engine_config")
-            if cfg:
-                ss.engine_config = EngineConfig(**cfg)
-            gs = data.get("game_state")
-            if gs:
-                sdict = gs.get("stats") or {}
-                q = []
-                for ev in (gs.get("delayed_queue") or []):
-                    try:
-                        q.append(
-                            DelayedEffect(
-                                due_month=int(ev.get("due_month")),
-                                delta=dict(ev.get("delta") or {}),
-                                hint=str(ev.get("hint") or ""),
-                                from_month=int(ev.get("from_month")),
-                            )
+    if up is None:
+        return
+    # The uploader keeps its file across reruns; import each file content only once.
+    file_bytes = up.getvalue()
+    file_hash = hashlib.sha256(file_bytes).hexdigest()
+    if ss.get("last_import_hash") == file_hash:
+        return
+    try:
+        data = json.loads(file_bytes.decode("utf-8"))
+        setup = data.get("setup") or {}
+        ss.player_name = setup.get("player_name", ss.get("player_name", ""))
+        ss.idea = setup.get("idea", "")
+        ss.mode_key = setup.get("mode_key", "Gerçekçi")
+        ss.character_key = setup.get("character_key", "anon")
+        ss.case_key = setup.get("case_key", "free")
+        ss.season_len = int(setup.get("season_len", 12))
+        ss.base_seed = int(setup.get("base_seed", 42))
+
+        cfg = data.get("engine_config")
+        if cfg:
+            ss.engine_config = EngineConfig.from_dict(cfg)
+        gs = data.get("game_state")
+        if gs:
+            sdict = gs.get("stats") or {}
+            q = []
+            for ev in (gs.get("delayed_queue") or []):
+                try:
+                    q.append(
+                        DelayedEffect(
+                            due_month=int(ev.get("due_month")),
+                            delta=dict(ev.get("delta") or {}),
+                            hint=str(ev.get("hint") or ""),
+                            from_month=int(ev.get("from_month")),
                         )
-                    except Exception:
-                        continue
-                ss.game_state = GameState(
-                    month=int(gs.get("month", 1)),
-                    stats=Stats(**{k: float(v) for k, v in dict(sdict).items()}),
-                    delayed_queue=q,
-                )
-
-            ss.logs = data.get("logs", []) or []
-            ss.history = data.get("history", []) or []
-            ss.started = True
-            ss.current_bundle = None
-            ss.current_draft = None
-            ss.current_raw = ""
-            st.sidebar.success("Run yüklendi.")
-            st.rerun()
-        except Exception as e:
-            st.sidebar.error(f"Import başarısız: {e}")
+                    )
+                except Exception:
+                    continue
+            base_stats = default_start_state().stats
+            known = stats_to_dict(base_stats)
+            ss.game_state = GameState(
+                month=int(gs.get("month", 1)),
+                stats=replace(base_stats, **{k: float(v) for k, v in dict(sdict).items() if k in known}),
+                delayed_queue=q,
+            )
+
+        ss.logs = data.get("logs", []) or []
+        ss.bundles = dict(data.get("bundles") or {})  # older exports inline "bundle" per log
+        ss.history = data.get("history", []) or []
+        ss.run_id = _now_id()  # new run identity
+        ss.pop("_export_memo", None)  # drop the previous run's serialized export
+        ss.last_import_hash = file_hash
+        ss.started = True
+        ss.current_bundle = None
+        ss.current_draft = None
+        ss.current_raw = ""
+        st.sidebar.success("Run yüklendi.")
+        st.rerun()
+    except Exception as e:
+        st.sidebar.error(f"Import başarısız: {e}")
 
 
 # =========================
@@ -972,46 +1214,59 @@ def sidebar() -> str:
 
     st.sidebar.markdown("---")
 
-    ss.player_name = st.sidebar.text_input("İsim", value=str(ss.get("player_name", "")))
-    ss.idea = st.sidebar.text_area("Ürün fikri (1-3 cümle)", value=str(ss.get("idea", "")), height=90)
-
-    mode_names = list(DEFAULT_MODES.keys())
-    mode_ix = mode_names.index(ss.mode_key) if ss.mode_key in mode_names else 0
-    ss.mode_key = st.sidebar.selectbox("Mod", mode_names, index=mode_ix, disabled=ss.started)
-    st.sidebar.caption(get_mode_spec(ss.mode_key).desc)
-
-    case_keys = list(CASES.keys())
-    case_labels = [CASES[k]["title"] for k in case_keys]
-    case_ix = case_keys.index(ss.case_key) if ss.case_key in case_keys else 0
-    ss.case_key = st.sidebar.selectbox("Vaka sezonu", case_keys, index=case_ix, format_func=lambda k: CASES[k]["title"], disabled=ss.started)
-    st.sidebar.caption(CASES[ss.case_key]["blurb"])
-
-    char_keys = list(CHARACTERS.keys())
-    char_ix = char_keys.index(ss.character_key) if ss.character_key in char_keys else 0
-    ss.character_key = st.sidebar.selectbox("Karakter", char_keys, index=char_ix, format_func=lambda k: CHARACTERS[k]["name"], disabled=ss.started)
-    st.sidebar.caption(CHARACTERS[ss.character_key]["trait"])
+    ps = _provider_status()
 
-    ss.season_len = st.sidebar.slider("Sezon uzunluğu (ay)", min_value=6, max_value=24, value=int(ss.season_len), step=1, disabled=ss.started)
-    ss.base_seed = st.sidebar.number_input("Seed (deterministik ekonomi)", value=int(ss.base_seed), step=1, disabled=ss.started)
+    # Setup inputs live in a form: typing in them does not rerun the app until submitted.
+    with st.sidebar.form("setup_form", clear_on_submit=False):
+        player_name = st.text_input("İsim", value=str(ss.get("player_name", "")))
+        idea = st.text_area("Ürün fikri (1-3 cümle)", value=str(ss.get("idea", "")), height=90)
+
+        mode_ix = _MODE_NAMES.index(ss.mode_key) if ss.mode_key in _MODE_NAMES else 0
+        mode_key = st.selectbox("Mod", _MODE_NAMES, index=mode_ix, disabled=ss.started)
+        st.caption(get_mode_spec(mode_key).desc)
+
+        case_ix = _CASE_KEYS.index(ss.case_key) if ss.case_key in _CASE_KEYS else 0
+        case_key = st.selectbox("Vaka sezonu", _CASE_KEYS, index=case_ix, format_func=lambda k: CASES[k]["title"], disabled=ss.started)
+        st.caption(CASES[case_key]["blurb"])
+
+        char_ix = _CHAR_KEYS.index(ss.character_key) if ss.character_key in _CHAR_KEYS else 0
+        character_key = st.selectbox("Karakter", _CHAR_KEYS, index=char_ix, format_func=lambda k: CHARACTERS[k]["name"], disabled=ss.started)
+        st.caption(CHARACTERS[character_key]["trait"])
+
+        season_len = st.slider("Sezon uzunluğu (ay)", min_value=6, max_value=24, value=int(ss.season_len), step=1, disabled=ss.started)
+        base_seed = st.number_input("Seed (deterministik ekonomi)", value=int(ss.base_seed), step=1, disabled=ss.started)
+
+        fcols = st.columns(2)
+        with fcols[0]:
+            applied = st.form_submit_button("Uygula", use_container_width=True)
+        with fcols[1]:
+            # Starting also applies the form, so pending edits are not lost.
+            start = st.form_submit_button("Sezonu başlat", disabled=ss.started or not ps.ok, use_container_width=True)
+
+    if applied or start:
+        ss.player_name = player_name
+        ss.idea = idea
+        if not ss.started:
+            ss.mode_key = mode_key
+            ss.case_key = case_key
+            ss.character_key = character_key
+            ss.season_len = season_len
+            ss.base_seed = base_seed
 
     st.sidebar.markdown("---")
 
-    ps = _provider_status()
     if ps.ok:
         st.sidebar.success(f"Gemini hazır ({ps.backend} / {ps.model})")
     else:
         st.sidebar.error("Gemini hazır değil")
         st.sidebar.caption(ps.error or "API key eksik")
 
-    cols = st.sidebar.columns(2)
-    with cols[0]:
-        if st.button("Sezonu başlat", disabled=ss.started or not ps.ok, use_container_width=True):
-            _start_run()
-            st.rerun()
-    with cols[1]:
-        if st.button("Reset", use_container_width=True):
-            _reset_run()
-            st.rerun()
+    if start:
+        _start_run()
+        st.rerun()
+    if st.sidebar.button("Reset", use_container_width=True):
+        _reset_run()
+        st.rerun()
 
     export_import_controls()
 
@@ -1025,6 +1280,32 @@ def sidebar() -> str:
 # =========================
 
 
+def _show_run_error(e: Exception) -> None:
+    """Render run errors for page_run and its fragments (fragment reruns bypass main)."""
+    # Friendlier handling for rate limits / quota exhaustion
+    if isinstance(e, RateLimitError):
+        delay = int(getattr(e, "retry_after_s", 0) or 0)
+        msg = str(e)
+        if delay > 0:
+            st.error(f"Sistem şu an cevap veremiyor: {msg}\n\n⏳ Öneri: {delay} saniye bekleyip tekrar dene.")
+        else:
+            st.error(f"Sistem şu an cevap veremiyor: {msg}")
+        st.info(
+            "Not: Gemini rate limit'leri **proje bazlıdır**, API key bazlı değil. Aynı projeden üretilmiş çok key, kota artışı sağlamaz. "
+            "Key havuzunun işe yaraması için key'lerin farklı projelere (tercihen farklı billing/tier) bağlı olması gerekir."
+        )
+    else:
+        st.error(f"Sistem şu an cevap veremiyor: {e}")
+        if 'API_KEY_INVALID' in str(e) or 'API key not valid' in str(e):
+            st.info(
+                "API key geçersiz görünüyor. Kontrol listesi: (1) Streamlit Secrets'te doğru anahtar mı? "
+                "(2) Anahtarda kopyalama sırasında boşluk/newline var mı? "
+                "(3) Google Cloud API Key restriction (HTTP referrer / IP) açıksa kaldır. "
+                "(4) Doğru servis: Google AI Studio / Generative Language API anahtarı."
+            )
+        st.info("Gemini timeout / API hatası olabilir. Debug sayfasından raw output'a bakabilirsin.")
+
+
 def main() -> None:
     _ensure_state()
     page = sidebar()
@@ -1044,28 +1325,7 @@ def main() -> None:
         try:
             page_run()
         except Exception as e:
-            # Friendlier handling for rate limits / quota exhaustion
-            if isinstance(e, RateLimitError):
-                delay = int(getattr(e, "retry_after_s", 0) or 0)
-                msg = str(e)
-                if delay > 0:
-                    st.error(f"Sistem şu an cevap veremiyor: {msg}\n\n⏳ Öneri: {delay} saniye bekleyip tekrar dene.")
-                else:
-                    st.error(f"Sistem şu an cevap veremiyor: {msg}")
-                st.info(
-                    "Not: Gemini rate limit'leri **proje bazlıdır**, API key bazlı değil. Aynı projeden üretilmiş çok key, kota artışı sağlamaz. "
-                    "Key havuzunun işe yaraması için key'lerin farklı projelere (tercihen farklı billing/tier) bağlı olması gerekir."
-                )
-            else:
-                st.error(f"Sistem şu an cevap veremiyor: {e}")
-                if 'API_KEY_INVALID' in str(e) or 'API key not valid' in str(e):
-                    st.info(
-                        "API key geçersiz görünüyor. Kontrol listesi: (1) Streamlit Secrets'te doğru anahtar mı? "
-                        "(2) Anahtarda kopyalama sırasında boşluk/newline var mı? "
-                        "(3) Google Cloud API Key restriction (HTTP referrer / IP) açıksa kaldır. "
-                        "(4) Doğru servis: Google AI Studio / Generative Language API anahtarı."
-                    )
-                st.info("Gemini timeout / API hatası olabilir. Debug sayfasından raw output'a bakabilirsin.")
+            _show_run_error(e)
             # keep bundle None so user can retry by rerun
             ss.current_bundle = None
     elif page == "Geçmiş":
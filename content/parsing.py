@@ -9,7 +9,8 @@ We do NOT execute code; we only:
 - normalize smart quotes
 - remove trailing commas
 - escape bare newlines inside quoted strings
-- json.loads, then ast.literal_eval fallback (after normalizing literals)
+- json.loads, then close a truncated object (open string/brackets) and retry,
+  then ast.literal_eval fallback (after normalizing literals)
 """
 
 from __future__ import annotations
@@ -21,7 +22,7 @@ from dataclasses import dataclass
 from typing import Any, Dict, Optional
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ParseResult:
     data: Optional[Dict[str, Any]]
     raw: str
@@ -30,6 +31,37 @@ class ParseResult:
 
 
 _FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)```", re.DOTALL | re.IGNORECASE)
+_TRAILING_COMMA_RE = re.compile(r",\s*([}\]])")
+_TRUE_RE = re.compile(r"\btrue\b", re.IGNORECASE)
+_FALSE_RE = re.compile(r"\bfalse\b", re.IGNORECASE)
+_NULL_RE = re.compile(r"\bnull\b", re.IGNORECASE)
+
+# A quoted string of either quote type, up to its closing quote or (unterminated) the end.
+_QUOTED_STRING_RE = re.compile(
+    r'"[^"\\]*(?:\\.[^"\\]*)*(?:"|\\?\Z)'
+    r"|'[^'\\]*(?:\\.[^'\\]*)*(?:'|\\?\Z)",
+    re.DOTALL,
+)
+# A double-quoted JSON string (group "q" is set only if it is terminated) or a bracket.
+_JSON_STRUCTURE_RE = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*(?:(?P<q>")|\\?\Z)|[\[\]{}]', re.DOTALL)
+_CLOSERS = {"{": "}", "[": "]"}
+# A bare literal or number cut off at the end, right after ":", "," or "[".
+_PARTIAL_SCALAR_RE = re.compile(r"[:,\[]\s*([A-Za-z]+|[-+\d.eE]+)\Z")
+_JSON_LITERALS = ("true", "false", "null")
+# An escape cut off at the end of an open string (a lone backslash or a short \\uXXXX).
+_PARTIAL_ESCAPE_RE = re.compile(r"(?<!\\)((?:\\\\)*)\\(?:u[0-9a-fA-F]{0,3})?\Z")
+# Single cleanup pass: a quoted string (newlines escaped) or a trailing comma outside strings.
+_CLEANUP_RE = re.compile(_QUOTED_STRING_RE.pattern + r"|,\s*(?P<close>[}\]])", re.DOTALL)
+_STRING_NEWLINE_RE = re.compile(r"\\.|[\r\n]", re.DOTALL)
+_NEWLINE_ESCAPES = {"\n": "\\n", "\r": "\\r"}
+
+_SMART_QUOTES = str.maketrans({
+    "\u201c": '"',
+    "\u201d": '"',
+    "\u2018": "'",
+    "\u2019": "'",
+    "\u00a0": " ",
+})
 
 
 def strip_code_fences(s: str) -> str:
@@ -55,72 +87,130 @@ def extract_first_object(s: str) -> str:
 
 
 def normalize_smart_quotes(s: str) -> str:
-    return (
-        (s or "")
-        .replace("\u201c", '"')
-        .replace("\u201d", '"')
-        .replace("\u2018", "'")
-        .replace("\u2019", "'")
-        .replace("\u00a0", " ")
-    )
+    return (s or "").translate(_SMART_QUOTES)
 
 
 def remove_trailing_commas(s: str) -> str:
-    return re.sub(r",\s*([}\]])", r"\1", s)
+    return _TRAILING_COMMA_RE.sub(r"\1", s)
+
+
+def _escape_string_newlines(m: "re.Match[str]") -> str:
+    body = m.group(0)
+    if "\n" not in body and "\r" not in body:
+        return body
+    if "\\" not in body:
+        return body.replace("\n", "\\n").replace("\r", "\\r")
+    # Walk escape pairs so an escaped newline (backslash + newline) is left as-is.
+    return _STRING_NEWLINE_RE.sub(lambda t: _NEWLINE_ESCAPES.get(t.group(0), t.group(0)), body)
 
 
 def escape_newlines_in_json_strings(s: str) -> str:
-    """Escape bare newlines inside quoted strings."""
+    """Escape bare newlines inside quoted strings.
+
+    Quoted spans ("..." or '...', unterminated ones run to the end) are found by
+    _QUOTED_STRING_RE; only those spans are rewritten.
+    """
     if not s:
         return s
+    return _QUOTED_STRING_RE.sub(_escape_string_newlines, s)
+
+
+def _to_jsonable(o: Any) -> Any:
+    """Convert a literal_eval result to the value json.loads(json.dumps(o)) would give."""
+    if o is None or isinstance(o, (str, int, float)):
+        return o
+    if isinstance(o, dict):
+        out: Dict[str, Any] = {}
+        for k, v in o.items():
+            if not isinstance(k, str):
+                if k is not None and not isinstance(k, (int, float)):
+                    raise TypeError(f"keys must be str, int, float, bool or None, not {type(k).__name__}")
+                k = json.dumps(k)
+            out[k] = _to_jsonable(v)
+        return out
+    if isinstance(o, (list, tuple)):
+        return [_to_jsonable(x) for x in o]
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
+def balance_truncated_json(s: str) -> str:
+    """Close an object cut off mid-way (e.g. at the output token limit).
+
+    Keeps the partial last element: terminates an open string, completes a cut
+    literal (tru -> true) or number (1. -> 1), drops a dangling comma, gives a
+    dangling key a null value and appends the missing closing brackets. Returns
+    s unchanged when it is already balanced or the brackets do not nest.
+    """
+    stack: list[str] = []
+    in_string = False
+    last_str = -1
+    for m in _JSON_STRUCTURE_RE.finditer(s):
+        tok = m.group(0)
+        if tok[0] == '"':
+            in_string = m.group("q") is None
+            last_str = m.start()
+        elif tok in _CLOSERS:
+            stack.append(_CLOSERS[tok])
+        elif not stack or stack.pop() != tok:
+            return s
+    if not stack:
+        return s
 
-    out = []
-    in_str = False
-    quote = ""
-    esc = False
-
-    for ch in s:
-        if in_str:
-            if esc:
-                out.append(ch)
-                esc = False
-                continue
-            if ch == "\\":
-                out.append(ch)
-                esc = True
-                continue
-            if ch == quote:
-                out.append(ch)
-                in_str = False
-                quote = ""
-                continue
-            if ch == "\n":
-                out.append("\\n")
-                continue
-            if ch == "\r":
-                out.append("\\r")
-                continue
-            out.append(ch)
+    out = s
+    if in_string:
+        out = _PARTIAL_ESCAPE_RE.sub(r"\1", out) + '"'
+    out = out.rstrip()
+    m = _PARTIAL_SCALAR_RE.search(out)
+    if m:
+        word = m.group(1)
+        if word[0].isalpha():
+            done = next((lit for lit in _JSON_LITERALS if lit.startswith(word.lower())), "null")
         else:
-            if ch in ('"', "'"):
-                out.append(ch)
-                in_str = True
-                quote = ch
-            else:
-                out.append(ch)
+            done = word.rstrip("+-.eE") or "null"
+        out = out[: m.start(1)] + done
+    if out.endswith(","):
+        out = out[:-1]
+    elif out.endswith(":"):
+        out += " null"
+    elif out.endswith('"') and stack[-1] == "}" and s[:last_str].rstrip().endswith(("{", ",")):
+        out += ": null"  # the cut came right after a key
+    return out + "".join(reversed(stack))
+
+
+def _clean_match(m: "re.Match[str]") -> str:
+    close = m.group("close")
+    if close is not None:
+        return close
+    return _escape_string_newlines(m)
+
+
+def escape_newlines_and_trailing_commas(s: str) -> str:
+    """escape_newlines_in_json_strings + remove_trailing_commas in one scan.
 
-    return "".join(out)
+    Unlike running them back to back, commas inside quoted strings are left alone.
+    """
+    if not s:
+        return s
+    return _CLEANUP_RE.sub(_clean_match, s)
 
 
 def try_parse_json(raw: str) -> ParseResult:
     """Best-effort parse. Returns ParseResult(data=None, error=...) on failure."""
     raw = (raw or "").strip()
 
+    # 0) Fast path: providers usually return clean JSON; skip the cleanup passes.
+    try:
+        obj0 = json.loads(raw)
+    except Exception:
+        pass
+    else:
+        if isinstance(obj0, dict):
+            return ParseResult(data=obj0, raw=raw, cleaned=raw)
+
     s = strip_code_fences(raw)
     s = extract_first_object(s)
     s = normalize_smart_quotes(s)
-    s = escape_newlines_in_json_strings(s)
-    s = remove_trailing_commas(s)
+    s = escape_newlines_and_trailing_commas(s)
 
     # 1) JSON
     try:
@@ -131,16 +221,33 @@ def try_parse_json(raw: str) -> ParseResult:
     except Exception as e_json:
         err1 = f"json.loads: {type(e_json).__name__}: {e_json}"
 
+    # 1b) Truncated JSON: close it locally instead of asking the model to repair it.
+    # Balance everything from the first "{" first: extract_first_object cuts at the
+    # last "}", which would drop a partial trailing element (e.g. the last option).
+    t = normalize_smart_quotes(strip_code_fences(raw))
+    i = t.find("{")
+    tail = escape_newlines_and_trailing_commas(t[i:]) if i >= 0 else s
+    for cand in (tail, s) if tail != s else (s,):
+        s_bal = balance_truncated_json(cand)
+        if s_bal == cand:
+            continue
+        try:
+            obj = json.loads(s_bal)
+            if isinstance(obj, dict):
+                return ParseResult(data=obj, raw=raw, cleaned=s_bal)
+        except Exception:
+            pass
+
     # 2) literal_eval fallback (single quotes, True/False/None)
     s2 = s
-    s2 = re.sub(r"\btrue\b", "True", s2, flags=re.IGNORECASE)
-    s2 = re.sub(r"\bfalse\b", "False", s2, flags=re.IGNORECASE)
-    s2 = re.sub(r"\bnull\b", "None", s2, flags=re.IGNORECASE)
+    s2 = _TRUE_RE.sub("True", s2)
+    s2 = _FALSE_RE.sub("False", s2)
+    s2 = _NULL_RE.sub("None", s2)
     try:
         obj2 = ast.literal_eval(s2)
         if isinstance(obj2, dict):
             # normalize into JSON-serializable types
-            return ParseResult(data=json.loads(json.dumps(obj2)), raw=raw, cleaned=s)
+            return ParseResult(data=_to_jsonable(obj2), raw=raw, cleaned=s)
         return ParseResult(data=None, raw=raw, cleaned=s, error=f"literal_eval root is not object; {err1}")
     except Exception as e_ast:
         err2 = f"literal_eval: {type(e_ast).__name__}: {e_ast}"
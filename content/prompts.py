@@ -26,6 +26,8 @@ ALLOWED_TAGS = [
     "security",
 ]
 
+_ALLOWED_TAGS_PIPE = "|".join(ALLOWED_TAGS)
+
 
 def _bucket(x: float, lo: float, hi: float) -> str:
     if x <= lo:
@@ -66,6 +68,55 @@ def describe_stats(stats: Mapping[str, Any]) -> str:
     )
 
 
+# Static head of the month prompt: identical for every call, so it comes first and
+# the provider can reuse it as a cached prefix. Per-month context is appended after it.
+_MONTH_PROMPT_STATIC = f"""
+Sen bir startup simülasyonu için aylık anlatı paketi üreten 'narrative designer'sın.
+
+Amaç:
+- Oyuncu karar vermek istemeli. Net trade-off, gerilim, sonuç hissi üret.
+- Oyuncu isterse kendi çözümünü de yazacak (UI). Sen yine de 2-3 güçlü seçenek üret.
+
+Görev (en alttaki bu ayın bağlamına göre):
+1) Bu ayın temasını tek cümlelik bir "month_title" ile kur.
+2) Açıklayıcı "durum_analizi" yaz (uzun form, analitik, net; 3-5 paragraf).
+3) Tek bir ana kriz üret: "kriz_title" + "kriz" (en az 3 paragraf).
+4) 2 veya 3 seçenek üret (options listesi):
+   - Her seçenek: id (A,B,(opsiyonel C)) + title + tag + risk + 4-6 adımlık plan (steps)
+   - Her seçenek için 2-4 kısa paragraf "result" yaz (seçilirse ne olur?).
+   - tag sadece şu listeden biri olmalı: {_ALLOWED_TAGS_PIPE}
+   - risk sadece: low|med|high
+5) (Opsiyonel ama önerilir) "lesson" alanına 1-2 cümlelik ders yaz.
+6) (Opsiyonel) "alternatives" alanına oyuncuya "farklı yöntem" olarak 2-3 kısa madde ekle.
+7) Ayın sonunda bir cümlelik "cliffhanger" yaz (gelecek ayı merak ettirsin).
+
+ÇIKTI FORMATIN: SADECE JSON (başka hiçbir metin yok, markdown yok).
+
+JSON ŞEMA:
+{{
+  "month_title": "string (>= 6 karakter)",
+  "durum_analizi": "string (>= 220 karakter)",
+  "kriz_title": "string (>= 6 karakter)",
+  "kriz": "string (>= 220 karakter)",
+  "options": [
+    {{
+      "id": "A",
+      "title": "string",
+      "tag": "{_ALLOWED_TAGS_PIPE}",
+      "risk": "low|med|high",
+      "steps": ["string", "string", "string", "string"],
+      "delayed_seed": "kısa anahtar kelime/ifade",
+      "result": "string"
+    }}
+  ],
+  "lesson": "string (opsiyonel)",
+  "alternatives": ["string", "string"],
+  "cliffhanger": "string",
+  "note": "string (opsiyonel)"
+}}
+""".strip()
+
+
 def build_prompt(
     *,
     month: int,
@@ -83,6 +134,7 @@ def build_prompt(
     """Build the month-generation prompt (v2 schema).
 
     The model MUST output ONLY JSON matching the expected schema.
+    Static instructions/schema come first (cacheable prefix); the month context last.
     """
 
     idea = (idea or "").strip() or "(boş)"
@@ -92,7 +144,6 @@ def build_prompt(
     last_tags_s = ", ".join(last_tags) if last_tags else "(yok)"
 
     stats_summary = describe_stats(stats)
-    allowed_tags = "|".join(ALLOWED_TAGS)
 
     char_line = ""
     if (character_name or character_trait).strip():
@@ -103,10 +154,9 @@ def build_prompt(
     if "Extreme" in (mode_title or ""):
         style = style + "; absürt olayları ölümcül ciddi bir dille anlat (deadpan), ironi buradan gelsin"
 
-    return f"""
-Sen bir startup simülasyonu için aylık anlatı paketi üreten 'narrative designer'sın.
+    return _MONTH_PROMPT_STATIC + f"""
 
-Bağlam:
+Bu ayın bağlamı:
 - Ay: {int(month)}
 - Mod: {mode_title} — {mode_desc}
 - Yazım tonu: {style}
@@ -116,48 +166,30 @@ Bağlam:
 - Son hamle etiketleri: {last_tags_s}
 - Şu an resim: {stats_summary}
 
-Amaç:
-- Oyuncu karar vermek istemeli. Net trade-off, gerilim, sonuç hissi üret.
-- Oyuncu isterse kendi çözümünü de yazacak (UI). Sen yine de 2-3 güçlü seçenek üret.
+Yukarıdaki şemaya uygun SADECE JSON döndür.
+""".rstrip()
 
-Görev:
-1) Bu ayın temasını tek cümlelik bir "month_title" ile kur.
-2) Açıklayıcı "durum_analizi" yaz (uzun form, analitik, net; 3-5 paragraf).
-3) Tek bir ana kriz üret: "kriz_title" + "kriz" (en az 3 paragraf).
-4) 2 veya 3 seçenek üret (options listesi):
-   - Her seçenek: id (A,B,(opsiyonel C)) + title + tag + risk + 4-6 adımlık plan (steps)
-   - Her seçenek için 2-4 kısa paragraf "result" yaz (seçilirse ne olur?).
-   - tag sadece şu listeden biri olmalı: {allowed_tags}
-   - risk sadece: low|med|high
-5) (Opsiyonel ama önerilir) "lesson" alanına 1-2 cümlelik ders yaz.
-6) (Opsiyonel) "alternatives" alanına oyuncuya "farklı yöntem" olarak 2-3 kısa madde ekle.
-7) Ayın sonunda bir cümlelik "cliffhanger" yaz (gelecek ayı merak ettirsin).
 
-ÇIKTI FORMATIN: SADECE JSON (başka hiçbir metin yok, markdown yok).
+# Static tail of the choice-intent prompt (task + schema), built once.
+_INTENT_PROMPT_TAIL = f"""Görev:
+- Bu çözümü bir "title" ile özetle.
+- Birincil "tag" seç (sadece: {_ALLOWED_TAGS_PIPE})
+- "risk" seç (low|med|high)
+- 3-6 maddelik uygulanabilir "steps" yaz.
+- "delayed_seed" üret (kısa anahtar ifade).
+- "result" alanına 1-3 kısa paragraf: bu plan uygulanırsa ne olur? (gerilim + sonuç hissi)
+
+ÇIKTI FORMATIN: SADECE JSON.
 
 JSON ŞEMA:
 {{
-  "month_title": "string (>= 6 karakter)",
-  "durum_analizi": "string (>= 220 karakter)",
-  "kriz_title": "string (>= 6 karakter)",
-  "kriz": "string (>= 220 karakter)",
-  "options": [
-    {{
-      "id": "A",
-      "title": "string",
-      "tag": "{allowed_tags}",
-      "risk": "low|med|high",
-      "steps": ["string", "string", "string", "string"],
-      "delayed_seed": "kısa anahtar kelime/ifade",
-      "result": "string"
-    }}
-  ],
-  "lesson": "string (opsiyonel)",
-  "alternatives": ["string", "string"],
-  "cliffhanger": "string",
-  "note": "string (opsiyonel)"
-}}
-""".strip()
+  "title": "string",
+  "tag": "{_ALLOWED_TAGS_PIPE}",
+  "risk": "low|med|high",
+  "steps": ["string", "string", "string"],
+  "delayed_seed": "string",
+  "result": "string"
+}}"""
 
 
 def build_choice_intent_prompt(
@@ -179,11 +211,8 @@ def build_choice_intent_prompt(
     if "Extreme" in (mode_title or ""):
         style = style + "; absürt olayları ölümcül ciddi bir dille anlat (deadpan), ironi buradan gelsin"
 
-    allowed_tags = "|".join(ALLOWED_TAGS)
-
     # Keep it short to reduce hallucination risk; we only need intent signals.
-    return f"""
-Sen bir startup simülasyonunda oyuncunun yazdığı serbest çözümü yapılandıran bir 'decision interpreter'sın.
+    return f"""Sen bir startup simülasyonunda oyuncunun yazdığı serbest çözümü yapılandıran bir 'decision interpreter'sın.
 Sadece JSON üret.
 
 Bağlam:
@@ -197,26 +226,7 @@ Bağlam:
 Oyuncunun çözümü (aynen):
 {player_text}
 
-Görev:
-- Bu çözümü bir "title" ile özetle.
-- Birincil "tag" seç (sadece: {allowed_tags})
-- "risk" seç (low|med|high)
-- 3-6 maddelik uygulanabilir "steps" yaz.
-- "delayed_seed" üret (kısa anahtar ifade).
-- "result" alanına 1-3 kısa paragraf: bu plan uygulanırsa ne olur? (gerilim + sonuç hissi)
-
-ÇIKTI FORMATIN: SADECE JSON.
-
-JSON ŞEMA:
-{{
-  "title": "string",
-  "tag": "{allowed_tags}",
-  "risk": "low|med|high",
-  "steps": ["string", "string", "string"],
-  "delayed_seed": "string",
-  "result": "string"
-}}
-""".strip()
+""" + _INTENT_PROMPT_TAIL
 
 
 def build_json_repair_prompt(broken_text: str) -> str:
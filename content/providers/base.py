@@ -14,7 +14,7 @@ from typing import Protocol, Tuple
 from ..schemas import MonthDraft
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ProviderStatus:
     ok: bool
     backend: str
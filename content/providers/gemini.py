@@ -11,17 +11,30 @@ Secrets/env loading is done in the Streamlit app.
 
 from __future__ import annotations
 
+import functools
 import json
 import re
+import threading
 import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from ..parsing import try_parse_json
+from ..prompts import build_json_expand_prompt, build_json_repair_prompt
 from ..schemas import MonthDraft, ChoiceIntent, draft_from_llm, intent_from_llm, validate_intent
 from .base import ProviderStatus
 
 
+# Model candidates, tried in order (the last model that answered goes first).
+DEFAULT_MODELS: Tuple[str, ...] = ("gemini-2.5-flash", "gemini-2.5-pro")
+
+# Low-temperature calls (repair/expand passes, near-greedy intents) are close to pure
+# functions of the prompt; their raw text is kept in a small per-provider LRU.
+_TEXT_CACHE_MAX_TEMPERATURE = 0.3
+_TEXT_CACHE_SIZE = 256
+
+
 class RateLimitError(RuntimeError):
     """Raised when the API returns a rate/quota error (HTTP 429 RESOURCE_EXHAUSTED)."""
 
@@ -30,9 +43,41 @@ class RateLimitError(RuntimeError):
         self.retry_after_s = int(retry_after_s or 0)
 
 
+@functools.lru_cache(maxsize=32)
+def _genai_client(api_key: str) -> Any:
+    """One google-genai client per API key for the whole process.
+
+    Key rotation (and any provider rebuilt for the same pool) reuses the client
+    and its HTTP connection pool. Failures are not cached.
+    """
+    from google import genai  # type: ignore
+
+    return genai.Client(api_key=api_key)
+
+
+# google-generativeai holds a single process-global API key; see _legacy_sdk().
+_legacy_api_key: Optional[str] = None
+
+
+def _legacy_sdk(api_key: str) -> Any:
+    """Return the legacy SDK configured for api_key, reconfiguring only on change.
+
+    configure() rebuilds the SDK's default client (and its transport), so repeated
+    calls with the same key would throw away the warm connection.
+    """
+    global _legacy_api_key
+    import google.generativeai as genai_legacy  # type: ignore
+
+    if _legacy_api_key != api_key:
+        genai_legacy.configure(api_key=api_key)
+        _legacy_api_key = api_key
+    return genai_legacy
+
+
 @dataclass
 class GeminiProvider:
     api_keys: List[str]
+    models: Tuple[str, ...] = DEFAULT_MODELS
 
     # runtime
     backend: str = "none"  # genai | legacy | none
@@ -46,20 +91,35 @@ class GeminiProvider:
     _cooldown_until: Dict[str, float] = field(default_factory=dict)  # key -> epoch seconds
     _dead_keys: set[str] = field(default_factory=set)
 
+    # model health: the last model that answered is tried first on the next call
+    _last_good_model: str = ""
+
+    # (prompt, temperature, max_output_tokens) -> raw text, see _TEXT_CACHE_MAX_TEMPERATURE
+    _text_cache: "OrderedDict[Tuple[str, float, int], str]" = field(default_factory=OrderedDict, repr=False)
+
+    # A single instance may be shared across Streamlit sessions (threads).
+    _lock: Any = field(default_factory=threading.RLock, repr=False)
+
     def __post_init__(self) -> None:
         self.api_keys = [k.strip() for k in (self.api_keys or []) if str(k).strip()]
+        self.models = tuple(m for m in (self.models or DEFAULT_MODELS) if m) or DEFAULT_MODELS
         self._init_backend()
 
     @staticmethod
-    def from_api_key_string(raw: str) -> "GeminiProvider":
+    def from_api_key_string(raw: str, models: Optional[Sequence[str]] = None) -> "GeminiProvider":
+        models_t = tuple(models) if models else DEFAULT_MODELS
         if not raw:
-            return GeminiProvider([])
+            return GeminiProvider([], models_t)
         raw = str(raw).strip()
         # allow comma-separated list in a single secret (GEMINI_API_KEY="k1,k2,k3")
         keys = [x.strip() for x in raw.split(",") if x.strip()] if "," in raw else [raw]
-        return GeminiProvider(keys)
+        return GeminiProvider(keys, models_t)
 
     def _init_backend(self) -> None:
+        with self._lock:
+            self._init_backend_locked()
+
+    def _init_backend_locked(self) -> None:
         self._client = None
         self._legacy = None
         self.backend = "none"
@@ -73,11 +133,9 @@ class GeminiProvider:
 
         # Try new SDK: google-genai
         try:
-            from google import genai  # type: ignore
-
-            self._client = genai.Client(api_key=self.api_keys[0])
+            self._client = _genai_client(self.api_keys[0])
             self.backend = "genai"
-            self.model_in_use = "gemini-2.5-pro"
+            self.model_in_use = self.models[0]
             self.last_error = ""
             return
         except Exception as e:
@@ -85,12 +143,9 @@ class GeminiProvider:
 
         # Try legacy: google-generativeai
         try:
-            import google.generativeai as genai_legacy  # type: ignore
-
-            genai_legacy.configure(api_key=self.api_keys[0])
-            self._legacy = genai_legacy
+            self._legacy = _legacy_sdk(self.api_keys[0])
             self.backend = "legacy"
-            self.model_in_use = "gemini-2.5-pro"
+            self.model_in_use = self.models[0]
             self.last_error = ""
             return
         except Exception as e:
@@ -98,15 +153,33 @@ class GeminiProvider:
             self.last_error = f"google-generativeai yok/başarısız: {e}"
 
     def status(self) -> ProviderStatus:
-        if self.backend == "none":
-            return ProviderStatus(False, "none", "", note="", error=str(self.last_error or ""))
-        return ProviderStatus(True, self.backend, self.model_in_use, note="", error="")
+        with self._lock:
+            if self.backend == "none":
+                return ProviderStatus(False, "none", "", note="", error=str(self.last_error or ""))
+            return ProviderStatus(True, self.backend, self.model_in_use, note="", error="")
 
     def _rotate_key(self) -> None:
-        if len(self.api_keys) <= 1:
-            return
-        self.api_keys = self.api_keys[1:] + self.api_keys[:1]
-        self._init_backend()
+        with self._lock:
+            if len(self.api_keys) <= 1:
+                return
+            self.api_keys = self.api_keys[1:] + self.api_keys[:1]
+            self._init_backend_locked()
+
+    def _mark_key_dead(self, key: str) -> None:
+        with self._lock:
+            self._dead_keys.add(key)
+            self._init_backend_locked()
+
+    def _cool_down_key(self, key: str, until: float) -> None:
+        with self._lock:
+            self._cooldown_until[key] = until
+
+    def _mark_model_good(self, model: str) -> None:
+        """Record a successful model and round-robin keys to spread load across the pool."""
+        with self._lock:
+            self.model_in_use = model
+            self._last_good_model = model
+            self._rotate_key()
 
     @staticmethod
     def _err_text(e: Exception) -> str:
@@ -158,25 +231,40 @@ class GeminiProvider:
 
     def _skip_key_if_cooldown(self) -> bool:
         """Rotate away if current key is cooling down. Returns True if rotated."""
-        if not self.api_keys:
+        with self._lock:
+            if not self.api_keys:
+                return False
+            k = self.api_keys[0]
+            until = float(self._cooldown_until.get(k, 0.0) or 0.0)
+            if until and time.time() < until:
+                self._rotate_key()
+                return True
             return False
-        k = self.api_keys[0]
-        until = float(self._cooldown_until.get(k, 0.0) or 0.0)
-        if until and time.time() < until:
-            self._rotate_key()
-            return True
-        return False
 
     def _generate_text(self, prompt: str, temperature: float, max_output_tokens: int) -> str:
-        # Prefer newest stable models first to avoid accidentally hitting models that have 0 quota in your tier.
-        candidates = [
-            "gemini-2.5-pro",
-            "gemini-2.5-flash",
-            "gemini-2.5-pro-latest",
-            "gemini-2.0-flash",
-            "gemini-1.5-pro",
-            "gemini-1.5-flash",
-        ]
+        if float(temperature) > _TEXT_CACHE_MAX_TEMPERATURE:
+            return self._generate_text_uncached(prompt, temperature, max_output_tokens)
+
+        key = (prompt, float(temperature), int(max_output_tokens))
+        with self._lock:
+            cached = self._text_cache.get(key)
+            if cached is not None:
+                self._text_cache.move_to_end(key)
+                return cached
+
+        txt = self._generate_text_uncached(prompt, temperature, max_output_tokens)
+        with self._lock:
+            self._text_cache[key] = txt
+            if len(self._text_cache) > _TEXT_CACHE_SIZE:
+                self._text_cache.popitem(last=False)
+        return txt
+
+    def _generate_text_uncached(self, prompt: str, temperature: float, max_output_tokens: int) -> str:
+        candidates: Sequence[str] = self.models
+        with self._lock:
+            last_good = self._last_good_model
+        if last_good in candidates and last_good != candidates[0]:
+            candidates = [last_good] + [m for m in candidates if m != last_good]
 
         last_err: Optional[Exception] = None
         last_retry_after: int = 0
@@ -189,9 +277,12 @@ class GeminiProvider:
             if self._skip_key_if_cooldown():
                 continue
 
-            current_key = self.api_keys[0] if self.api_keys else ""
+            # Snapshot the client: another session may rotate keys mid-call.
+            with self._lock:
+                current_key = self.api_keys[0] if self.api_keys else ""
+                backend, client, legacy = self.backend, self._client, self._legacy
 
-            if self.backend == "genai" and self._client is not None:
+            if backend == "genai" and client is not None:
                 for m in candidates:
                     try:
                         cfg: Dict[str, Any] = {
@@ -202,23 +293,20 @@ class GeminiProvider:
                         try:
                             cfg2 = dict(cfg)
                             cfg2["response_mime_type"] = "application/json"
-                            resp = self._client.models.generate_content(model=m, contents=prompt, config=cfg2)
+                            resp = client.models.generate_content(model=m, contents=prompt, config=cfg2)
                         except TypeError:
-                            resp = self._client.models.generate_content(model=m, contents=prompt, config=cfg)
+                            resp = client.models.generate_content(model=m, contents=prompt, config=cfg)
 
                         txt = (getattr(resp, "text", "") or "").strip()
                         if txt:
-                            self.model_in_use = m
-                            # Round-robin keys to spread load across pool (session-level).
-                            self._rotate_key()
+                            self._mark_model_good(m)
                             return txt
                     except Exception as e:
                         last_err = e
                         msg = self._err_text(e)
                         # Key invalid => mark dead and move on quickly.
                         if self._is_key_invalid(e):
-                            self._dead_keys.add(current_key)
-                            self._init_backend()
+                            self._mark_key_dead(current_key)
                             break
 
                         # Quota / rate limit handling:
@@ -227,12 +315,11 @@ class GeminiProvider:
                             last_retry_after = max(last_retry_after, delay)
                             # If this key's project has limit 0 for the model/tier, it's effectively unusable.
                             if self._has_limit_zero(msg):
-                                self._dead_keys.add(current_key)
-                                self._init_backend()
+                                self._mark_key_dead(current_key)
                                 break
                             # If server told us to wait, put this key on cooldown and rotate.
                             if delay >= 1:
-                                self._cooldown_until[current_key] = now + float(delay)
+                                self._cool_down_key(current_key, now + float(delay))
                                 break
                             # Otherwise, try next model with same key (some models may still be available).
                             continue
@@ -240,10 +327,10 @@ class GeminiProvider:
                         # other errors: try next model
                         continue
 
-            if self.backend == "legacy" and self._legacy is not None:
+            if backend == "legacy" and legacy is not None:
                 for m in candidates:
                     try:
-                        model = self._legacy.GenerativeModel(m)
+                        model = legacy.GenerativeModel(m)
                         try:
                             resp = model.generate_content(
                                 prompt,
@@ -263,25 +350,22 @@ class GeminiProvider:
                             )
                         txt = (getattr(resp, "text", "") or "").strip()
                         if txt:
-                            self.model_in_use = m
-                            self._rotate_key()
+                            self._mark_model_good(m)
                             return txt
                     except Exception as e:
                         last_err = e
                         msg = self._err_text(e)
                         if self._is_key_invalid(e):
-                            self._dead_keys.add(current_key)
-                            self._init_backend()
+                            self._mark_key_dead(current_key)
                             break
                         if self._is_rate_or_quota(e):
                             delay = self._retry_after_seconds_from_error_text(msg)
                             last_retry_after = max(last_retry_after, delay)
                             if self._has_limit_zero(msg):
-                                self._dead_keys.add(current_key)
-                                self._init_backend()
+                                self._mark_key_dead(current_key)
                                 break
                             if delay >= 1:
-                                self._cooldown_until[current_key] = now + float(delay)
+                                self._cool_down_key(current_key, now + float(delay))
                                 break
                             continue
                         continue
@@ -302,13 +386,6 @@ class GeminiProvider:
         res = try_parse_json(raw)
         if res.data:
             return res.data
-        # try direct json as last attempt
-        try:
-            obj = json.loads(raw)
-            if isinstance(obj, dict):
-                return obj
-        except Exception:
-            pass
         raise ValueError(res.error or "JSON parse edilemedi")
 
     def generate_month_draft(
@@ -348,8 +425,6 @@ class GeminiProvider:
                 # JSON parsed but failed our min-length / min-steps constraints. We run up to 3 enrichment passes:
                 #   1) Expand (soft)  2) Expand (hard)  3) Regenerate with stricter constraints
                 try:
-                    from ..prompts import build_json_expand_prompt
-
                     canonical = json.dumps(data, ensure_ascii=False, indent=2)
 
                     # Pass 1: soft expand
@@ -411,8 +486,6 @@ class GeminiProvider:
                 raise RuntimeError(self.last_error or "Gemini çıktı çok kısa kaldı (auto-expand başarısız).")
 
         if repair_on_fail:
-            from ..prompts import build_json_repair_prompt
-
             repair_prompt = build_json_repair_prompt(raw)
             raw2 = self._generate_text(repair_prompt, temperature=0.1, max_output_tokens=max_output_tokens + 300)
             data2 = self._parse_or_raise(raw2)
@@ -440,8 +513,6 @@ class GeminiProvider:
             self.last_error = f"{type(e).__name__}: {e}"
 
         if repair_on_fail:
-            from ..prompts import build_json_repair_prompt
-
             repair_prompt = build_json_repair_prompt(raw)
             raw2 = self._generate_text(repair_prompt, temperature=0.1, max_output_tokens=max_output_tokens + 200)
             data2 = self._parse_or_raise(raw2)
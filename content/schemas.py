@@ -20,7 +20,7 @@ from typing import Any, Dict, List, Mapping, Optional
 
 Delta = Dict[str, float]
 
-ALLOWED_TAGS = {
+ALLOWED_TAGS = frozenset({
     "growth",
     "efficiency",
     "reliability",
@@ -31,10 +31,11 @@ ALLOWED_TAGS = {
     "sales",
     "marketing",
     "security",
-}
+})
 
-ALLOWED_RISKS = {"low", "med", "high"}
-ALLOWED_OPTION_IDS = {"A", "B", "C"}
+ALLOWED_RISKS = frozenset({"low", "med", "high"})
+ALLOWED_OPTION_IDS = frozenset({"A", "B", "C"})
+_DEFAULT_OPTION_IDS = ("A", "B", "C")  # positional ids for options that omit one
 
 
 def _as_float(x: Any, default: float = 0.0) -> float:
@@ -44,6 +45,15 @@ def _as_float(x: Any, default: float = 0.0) -> float:
         return float(default)
 
 
+def _get_str(d: Mapping[str, Any], *keys: str, default: str = "") -> str:
+    """First truthy value among keys as a stripped str, else default."""
+    for k in keys:
+        v = d.get(k)
+        if v:
+            return str(v).strip()
+    return default
+
+
 def normalize_delta(d: Mapping[str, Any]) -> Delta:
     out: Dict[str, float] = {}
     for k, v in dict(d).items():
@@ -53,39 +63,40 @@ def normalize_delta(d: Mapping[str, Any]) -> Delta:
     return out
 
 
+# Canonical value for every accepted spelling (allowed values + common TR variants).
+_TAG_CANON: Dict[str, str] = {t: t for t in ALLOWED_TAGS}
+_TAG_CANON.update({
+    "büyüme": "growth",
+    "verimlilik": "efficiency",
+    "güvenilirlik": "reliability",
+    "uyum": "compliance",
+    "yatırım": "fundraising",
+    "insan": "people",
+    "ürün": "product",
+    "satış": "sales",
+    "pazarlama": "marketing",
+    "güvenlik": "security",
+})
+
+_RISK_CANON: Dict[str, str] = {r: r for r in ALLOWED_RISKS}
+_RISK_CANON.update({
+    "düşük": "low",
+    "orta": "med",
+    "yüksek": "high",
+})
+
+
 def normalize_tag(tag: Any, default: str = "growth") -> str:
-    t = str(tag or "").strip().lower()
-    if t in ALLOWED_TAGS:
-        return t
-    # common TR variants
-    aliases = {
-        "büyüme": "growth",
-        "verimlilik": "efficiency",
-        "güvenilirlik": "reliability",
-        "uyum": "compliance",
-        "yatırım": "fundraising",
-        "insan": "people",
-        "ürün": "product",
-        "satış": "sales",
-        "pazarlama": "marketing",
-        "güvenlik": "security",
-    }
-    return aliases.get(t, default)
+    # Fast path: validators re-normalize values that are already canonical.
+    if type(tag) is str and tag in ALLOWED_TAGS:
+        return tag
+    return _TAG_CANON.get(str(tag or "").strip().lower(), default)
 
 
 def normalize_risk(risk: Any, default: str = "med") -> str:
-    r = str(risk or "").strip().lower()
-    if r in ALLOWED_RISKS:
-        return r
-    aliases = {
-        "low": "low",
-        "med": "med",
-        "high": "high",
-        "düşük": "low",
-        "orta": "med",
-        "yüksek": "high",
-    }
-    return aliases.get(r, default)
+    if type(risk) is str and risk in ALLOWED_RISKS:
+        return risk
+    return _RISK_CANON.get(str(risk or "").strip().lower(), default)
 
 
 def normalize_steps(steps: Any) -> List[str]:
@@ -95,12 +106,7 @@ def normalize_steps(steps: Any) -> List[str]:
         parts = [x.strip(" -•\t") for x in steps.splitlines()]
         return [p for p in parts if p]
     if isinstance(steps, list):
-        out: List[str] = []
-        for x in steps:
-            s = str(x or "").strip()
-            if s:
-                out.append(s)
-        return out
+        return [s for s in (str(x or "").strip() for x in steps) if s]
     return [str(steps).strip()] if str(steps).strip() else []
 
 
@@ -109,7 +115,7 @@ def normalize_steps(steps: Any) -> List[str]:
 # =========================
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OptionDraft:
     """LLM option intent (narrative-only)."""
 
@@ -133,7 +139,7 @@ class OptionDraft:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MonthDraft:
     """Narrative-only month package returned by the LLM."""
 
@@ -203,17 +209,17 @@ def validate_month_draft(d: MonthDraft) -> None:
 
 
 def _parse_option(obj: Mapping[str, Any], *, default_id: str) -> OptionDraft:
-    oid = str(obj.get("id") or default_id).strip().upper()
+    oid = _get_str(obj, "id", default=default_id).upper()
     if oid not in ALLOWED_OPTION_IDS:
         oid = default_id
     return OptionDraft(
         id=oid,
-        title=str(obj.get("title") or obj.get("label") or f"Seçenek {oid}").strip(),
+        title=_get_str(obj, "title", "label", default=f"Seçenek {oid}"),
         tag=normalize_tag(obj.get("tag") or obj.get("focus") or "growth"),
         steps=normalize_steps(obj.get("steps", [])),
         risk=normalize_risk(obj.get("risk", "med")),
-        delayed_seed=str(obj.get("delayed_seed", "") or "").strip()[:60],
-        result=str(obj.get("result", "") or "").strip(),
+        delayed_seed=_get_str(obj, "delayed_seed")[:60],
+        result=_get_str(obj, "result"),
     )
 
 
@@ -238,14 +244,14 @@ def draft_from_llm_v1(data: Mapping[str, Any], month_id: int) -> MonthDraft:
 
     d = MonthDraft(
         month_id=int(month_id),
-        month_title=str(data.get("month_title") or month_title).strip(),
-        durum_analizi=str(data.get("durum_analizi", "") or "").strip(),
-        kriz_title=str(data.get("kriz_title") or kriz_title).strip(),
-        kriz=str(data.get("kriz", "") or "").strip(),
+        month_title=_get_str(data, "month_title", default=month_title),
+        durum_analizi=_get_str(data, "durum_analizi"),
+        kriz_title=_get_str(data, "kriz_title", default=kriz_title),
+        kriz=_get_str(data, "kriz"),
         options=options,
-        note=str(data.get("note", "") or "").strip(),
-        cliffhanger=str(data.get("cliffhanger", "") or "").strip(),
-        lesson=str(data.get("lesson", "") or "").strip(),
+        note=_get_str(data, "note"),
+        cliffhanger=_get_str(data, "cliffhanger"),
+        lesson=_get_str(data, "lesson"),
         alternatives=normalize_steps(data.get("alternatives", [])),
     )
     validate_month_draft(d)
@@ -260,11 +266,10 @@ def draft_from_llm_v2(data: Mapping[str, Any], month_id: int) -> MonthDraft:
     options: List[OptionDraft] = []
     if isinstance(raw_opts, list):
         # default ids A/B/C in order if missing
-        defaults = ["A", "B", "C"]
-        for i, obj in enumerate(raw_opts[:3]):
+        for default_id, obj in zip(_DEFAULT_OPTION_IDS, raw_opts):
             if not isinstance(obj, dict):
                 continue
-            options.append(_parse_option(obj, default_id=defaults[i]))
+            options.append(_parse_option(obj, default_id=default_id))
     else:
         # some models may still emit A/B keys
         return draft_from_llm_v1(data, month_id=int(month_id))
@@ -274,14 +279,14 @@ def draft_from_llm_v2(data: Mapping[str, Any], month_id: int) -> MonthDraft:
 
     d = MonthDraft(
         month_id=int(month_id),
-        month_title=str(data.get("month_title") or f"Ay {int(month_id)}").strip(),
-        durum_analizi=str(data.get("durum_analizi", "") or "").strip(),
-        kriz_title=str(data.get("kriz_title") or "Kriz").strip(),
-        kriz=str(data.get("kriz", "") or "").strip(),
+        month_title=_get_str(data, "month_title", default=f"Ay {int(month_id)}"),
+        durum_analizi=_get_str(data, "durum_analizi"),
+        kriz_title=_get_str(data, "kriz_title", default="Kriz"),
+        kriz=_get_str(data, "kriz"),
         options=options,
-        note=str(data.get("note", "") or "").strip(),
-        cliffhanger=str(data.get("cliffhanger", "") or "").strip(),
-        lesson=str(data.get("lesson", "") or "").strip(),
+        note=_get_str(data, "note"),
+        cliffhanger=_get_str(data, "cliffhanger"),
+        lesson=_get_str(data, "lesson"),
         alternatives=normalize_steps(data.get("alternatives", [])),
     )
     validate_month_draft(d)
@@ -300,7 +305,7 @@ def draft_from_llm(data: Mapping[str, Any], month_id: int) -> MonthDraft:
 # =========================
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ChoiceIntent:
     """LLM interpretation of a player's custom plan."""
 
@@ -324,12 +329,12 @@ class ChoiceIntent:
 
 def intent_from_llm(data: Mapping[str, Any]) -> ChoiceIntent:
     return ChoiceIntent(
-        title=str(data.get("title") or "Kullanıcının Planı").strip(),
+        title=_get_str(data, "title", default="Kullanıcının Planı"),
         tag=normalize_tag(data.get("tag") or "product"),
         steps=normalize_steps(data.get("steps", [])),
         risk=normalize_risk(data.get("risk", "med")),
-        delayed_seed=str(data.get("delayed_seed", "") or "").strip()[:60],
-        result=str(data.get("result", "") or "").strip(),
+        delayed_seed=_get_str(data, "delayed_seed")[:60],
+        result=_get_str(data, "result"),
     )
 
 
@@ -351,7 +356,7 @@ def validate_intent(i: ChoiceIntent) -> None:
 # =========================
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DelayedEffectSpec:
     delay_months: int
     delta: Delta
@@ -361,7 +366,7 @@ class DelayedEffectSpec:
         return {"delay_months": int(self.delay_months), "delta": dict(self.delta), "description": str(self.description)}
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OptionSpec:
     id: str  # A|B|C|YOU
     label: str
@@ -387,7 +392,7 @@ class OptionSpec:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MonthBundle:
     month_id: int
     title: str
@@ -402,6 +407,14 @@ class MonthBundle:
     cliffhanger: str = ""
     lesson: str = ""
     alternatives: List[str] = field(default_factory=list)
+    # id -> option index, built once (bundles are never mutated after construction).
+    _options_by_id: Dict[str, OptionSpec] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_options_by_id", {str(o.id): o for o in self.options})
+
+    def get_option(self, option_id: str) -> Optional[OptionSpec]:
+        return self._options_by_id.get(option_id)
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -440,7 +453,7 @@ def validate_month_bundle(b: MonthBundle) -> None:
         raise ValueError("option ids must be unique")
 
     for o in b.options:
-        if str(o.id).upper() not in {"A", "B", "C"} and str(o.id) != "YOU":
+        if str(o.id).upper() not in ALLOWED_OPTION_IDS and str(o.id) != "YOU":
             raise ValueError("invalid option id")
         if len((o.label or "").strip()) < 3:
             raise ValueError("option label too short")
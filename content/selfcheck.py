@@ -0,0 +1,44 @@
+"""
+content.selfcheck
+Minimal "it runs" proof for the content layer.
+
+Run:
+  python -m content.selfcheck
+"""
+
+from __future__ import annotations
+
+import json
+
+from .parsing import try_parse_json
+
+
+def truncated_month_draft() -> None:
+    draft = {
+        "month_title": "Ay 3: Nakit Sıkışması",
+        "durum_analizi": "Kasada 4 ay kaldı.",
+        "kriz_title": "Yatırımcı Sessiz",
+        "kriz": "Tohum turu gecikiyor.",
+        "options": [
+            {"id": "A", "title": "Fiyatı artır", "tag": "pricing", "steps": ["Planları sadeleştir"], "risk": "med"},
+            {"id": "B", "title": "Ekibi küçült", "tag": "cost", "steps": ["İki pozisyonu dondur"], "risk": "high"},
+        ],
+    }
+    raw = "```json\n" + json.dumps(draft, ensure_ascii=False, indent=2)
+
+    # Reply cut off inside the last option: the partial option is kept, not dropped
+    cut = raw[: raw.index("Ekibi küçült") + len("Ekibi")]
+    data = try_parse_json(cut).data
+    assert data is not None
+    assert [o.get("id") for o in data["options"]] == ["A", "B"]
+    assert data["options"][1]["title"] == "Ekibi"
+
+    # Every cut after the first option closes into an object
+    for n in range(raw.index('"B"'), len(raw)):
+        assert try_parse_json(raw[:n]).data is not None, raw[:n]
+
+    print("OK: truncated month draft parse passed.")
+
+
+if __name__ == "__main__":
+    truncated_month_draft()
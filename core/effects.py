@@ -9,8 +9,9 @@ Economy / physics rules:
 
 from __future__ import annotations
 
+import math
 import random
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, Iterable, List, Tuple
 
 from .modes import ModeSpec
 from .rng import rng_from
@@ -32,18 +33,27 @@ TEMPLATES: Dict[str, Dict[str, Tuple[float, float]]] = {
 }
 
 
+# TEMPLATES as (stat, base - var, base + var) rows, so sampling does no per-call arithmetic.
+_TEMPLATE_BOUNDS: Dict[str, Tuple[Tuple[str, float, float], ...]] = {
+    tag: tuple((k, base - var, base + var) for k, (base, var) in tpl.items())
+    for tag, tpl in TEMPLATES.items()
+}
+_DEFAULT_TEMPLATE_BOUNDS = _TEMPLATE_BOUNDS["growth"]
+
 
 def sample_delta(tag: str, rng: random.Random, swing: float) -> Delta:
-    tpl = TEMPLATES.get(tag, TEMPLATES["growth"])
-    d: Dict[str, float] = {}
-    for k, (base, var) in tpl.items():
-        val = rng.uniform(base - var, base + var) * float(swing)
-        d[k] = float(val)
-    d["churn"] = clamp(float(d.get("churn", 0.0)), -0.05, 0.08)
+    rows = _TEMPLATE_BOUNDS.get(tag, _DEFAULT_TEMPLATE_BOUNDS)
+    uniform = rng.uniform
+    swing = float(swing)
+    d: Dict[str, float] = {k: uniform(lo, hi) * swing for k, lo, hi in rows}
+    d["churn"] = clamp(d.get("churn", 0.0), -0.05, 0.08)
     return d
 
 
 def mode_adjustments(d: Delta, rng: random.Random, mode_key: str, spec: ModeSpec) -> Delta:
+    """Mode-specific pressure on a sampled delta. Returns d itself when the mode adds none."""
+    if not spec.antagonistic and mode_key != "Zor":
+        return d
     d2 = dict(d)
     if spec.antagonistic:
         d2["cash"] = float(d2.get("cash", 0.0)) - rng.uniform(10_000, 40_000) * spec.swing
@@ -55,55 +65,85 @@ def mode_adjustments(d: Delta, rng: random.Random, mode_key: str, spec: ModeSpec
     return d2
 
 
+# (case_key, tag) -> additive (stat, amount) adjustments, applied in order.
+_CASE_BIAS: Dict[Tuple[str, str], Tuple[Tuple[str, float], ...]] = {}
+for _tag in ("compliance", "security"):
+    _CASE_BIAS[("facebook_privacy_2019", _tag)] = (("reputation", 3.0), ("churn", -0.004))
+for _tag in ("growth", "marketing"):
+    _CASE_BIAS[("facebook_privacy_2019", _tag)] = (("reputation", -2.0), ("churn", 0.004))
+for _tag in ("product", "growth", "marketing"):
+    _CASE_BIAS[("blackberry_platform_shift", _tag)] = (("mrr", 250.0),)
+_CASE_BIAS[("blackberry_platform_shift", "reliability")] = (("mrr", -150.0),)
+_CASE_BIAS[("wework_ipo_2019", "fundraising")] = (("cash", 60_000.0), ("reputation", -1.5))
+_CASE_BIAS[("wework_ipo_2019", "efficiency")] = (("reputation", 1.5),)
+del _tag
+
+
 def apply_case_bias(d: Delta, case_key: str, tag: str, month: int) -> Delta:
+    """Add the case's bias for this tag. Returns d itself when the case has none."""
     # Keep identical to legacy behavior for now.
+    bias = _CASE_BIAS.get((case_key, tag))
+    if bias is None:
+        return d
     out = dict(d)
-    if case_key == "facebook_privacy_2019":
-        if tag in {"compliance", "security"}:
-            out["reputation"] = float(out.get("reputation", 0.0)) + 3.0
-            out["churn"] = float(out.get("churn", 0.0)) - 0.004
-        if tag in {"growth", "marketing"}:
-            out["reputation"] = float(out.get("reputation", 0.0)) - 2.0
-            out["churn"] = float(out.get("churn", 0.0)) + 0.004
-    if case_key == "blackberry_platform_shift":
-        if tag in {"product", "growth", "marketing"}:
-            out["mrr"] = float(out.get("mrr", 0.0)) + 250
-        if tag == "reliability":
-            out["mrr"] = float(out.get("mrr", 0.0)) - 150
-    if case_key == "wework_ipo_2019":
-        if tag == "fundraising":
-            out["cash"] = float(out.get("cash", 0.0)) + 60_000
-            out["reputation"] = float(out.get("reputation", 0.0)) - 1.5
-        if tag == "efficiency":
-            out["reputation"] = float(out.get("reputation", 0.0)) + 1.5
+    for k, amount in bias:
+        out[k] = float(out.get(k, 0.0)) + amount
     return out
 
 
 def apply_delta(stats: Stats, delta: Delta) -> Stats:
-    """Apply delta with clamp rules (pure function)."""
-    cash = max(0.0, stats.cash + float(delta.get("cash", 0.0)))
-    mrr = max(0.0, stats.mrr + float(delta.get("mrr", 0.0)))
-    reputation = clamp(stats.reputation + float(delta.get("reputation", 0.0)), 0.0, 100.0)
-    support_load = clamp(stats.support_load + float(delta.get("support_load", 0.0)), 0.0, 100.0)
-    infra_load = clamp(stats.infra_load + float(delta.get("infra_load", 0.0)), 0.0, 100.0)
-    churn = clamp(stats.churn + float(delta.get("churn", 0.0)), 0.0, 0.50)
-    morale = clamp(stats.morale + float(delta.get("morale", 0.0)), 0.0, 100.0)
-    tech_debt = clamp(stats.tech_debt + float(delta.get("tech_debt", 0.0)), 0.0, 100.0)
+    """Apply delta with clamp rules (pure function).
+
+    clamp() is inlined as max(lo, min(hi, x)): this runs several times per month.
+    """
+    get = delta.get
+    return Stats(
+        cash=max(0.0, stats.cash + float(get("cash", 0.0))),
+        mrr=max(0.0, stats.mrr + float(get("mrr", 0.0))),
+        reputation=max(0.0, min(100.0, stats.reputation + float(get("reputation", 0.0)))),
+        support_load=max(0.0, min(100.0, stats.support_load + float(get("support_load", 0.0)))),
+        infra_load=max(0.0, min(100.0, stats.infra_load + float(get("infra_load", 0.0)))),
+        churn=max(0.0, min(0.50, stats.churn + float(get("churn", 0.0)))),
+        morale=max(0.0, min(100.0, stats.morale + float(get("morale", 0.0)))),
+        tech_debt=max(0.0, min(100.0, stats.tech_debt + float(get("tech_debt", 0.0)))),
+    )
+
+
+def apply_deltas(stats: Stats, deltas: Iterable[Delta]) -> Stats:
+    """Apply deltas in order with clamp rules; same result as chained apply_delta calls.
+
+    Clamps after every delta (order matters at the bounds) but builds one Stats.
+    """
+    cash, mrr, reputation, support_load = stats.cash, stats.mrr, stats.reputation, stats.support_load
+    infra_load, churn, morale, tech_debt = stats.infra_load, stats.churn, stats.morale, stats.tech_debt
+    for delta in deltas:
+        get = delta.get
+        cash = max(0.0, cash + float(get("cash", 0.0)))
+        mrr = max(0.0, mrr + float(get("mrr", 0.0)))
+        reputation = max(0.0, min(100.0, reputation + float(get("reputation", 0.0))))
+        support_load = max(0.0, min(100.0, support_load + float(get("support_load", 0.0))))
+        infra_load = max(0.0, min(100.0, infra_load + float(get("infra_load", 0.0))))
+        churn = max(0.0, min(0.50, churn + float(get("churn", 0.0))))
+        morale = max(0.0, min(100.0, morale + float(get("morale", 0.0))))
+        tech_debt = max(0.0, min(100.0, tech_debt + float(get("tech_debt", 0.0))))
     return Stats(
-        cash=float(cash),
-        mrr=float(mrr),
-        reputation=float(reputation),
-        support_load=float(support_load),
-        infra_load=float(infra_load),
-        churn=float(churn),
-        morale=float(morale),
-        tech_debt=float(tech_debt),
+        cash=cash,
+        mrr=mrr,
+        reputation=reputation,
+        support_load=support_load,
+        infra_load=infra_load,
+        churn=churn,
+        morale=morale,
+        tech_debt=tech_debt,
     )
 
 
 def due_delayed_effects(queue: List[DelayedEffect], month: int) -> Tuple[List[DelayedEffect], List[DelayedEffect]]:
-    due = [x for x in queue if int(x.due_month) == int(month)]
-    remaining = [x for x in queue if int(x.due_month) != int(month)]
+    m = int(month)
+    due: List[DelayedEffect] = []
+    remaining: List[DelayedEffect] = []
+    for x in queue:
+        (due if int(x.due_month) == m else remaining).append(x)
     return due, remaining
 
 
@@ -119,7 +159,10 @@ def schedule_delayed_effect(
     seed_phrase: str,
     spec: ModeSpec,
 ) -> List[DelayedEffect]:
-    """Possibly enqueue a delayed effect. Returns the new queue."""
+    """Possibly enqueue a delayed effect.
+
+    Appends to `queue` in place (callers pass a fresh list) and returns it.
+    """
     rng = rng_from('delay-roll', scenario_seed, month, choice_key, base_seed=base_seed)
     p = {"low": 0.35, "med": 0.60, "high": 0.82}.get(risk, 0.60)
     if spec.antagonistic:
@@ -147,7 +190,8 @@ def schedule_delayed_effect(
         hint=(seed_phrase or "Gecikmeli etki")[:80],
         from_month=int(month),
     )
-    return [*queue, new_item]
+    queue.append(new_item)
+    return queue
 
 
 def turkey_macro_cost(*, base_seed: int, scenario_seed: int, month: int) -> float:
@@ -177,10 +221,8 @@ def apply_delayed_effects_due(state: "GameState", month: int) -> tuple["GameStat
     """Apply due delayed effects for this month and remove them from queue."""
     from .state import GameState
 
-    due, remaining = due_delayed_effects(list(state.delayed_queue), int(month))
-    stats = state.stats
-    for ev in due:
-        stats = apply_delta(stats, ev.delta)
+    due, remaining = due_delayed_effects(state.delayed_queue, int(month))
+    stats = apply_deltas(state.stats, [ev.delta for ev in due]) if due else state.stats
     return GameState(month=int(state.month), stats=stats, delayed_queue=remaining), due
 
 
@@ -199,7 +241,7 @@ def apply_monthly_burn(
     """
     from .state import GameState
 
-    fixed = float(sum(float(v) for v in dict(expenses).values()))
+    fixed = math.fsum(expenses.values())
     macro = float(turkey_macro_cost(base_seed=int(base_seed), scenario_seed=int(scenario_seed), month=int(month))) if turkey_mode else 0.0
 
     net = float(state.stats.mrr) - fixed - macro
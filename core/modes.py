@@ -7,6 +7,7 @@ Kept in core so balancing lives in one place, but UI can still display labels.
 
 from __future__ import annotations
 
+import functools
 from dataclasses import dataclass
 from typing import Dict
 
@@ -89,5 +90,9 @@ DEFAULT_MODES: Dict[str, ModeSpec] = {
 }
 
 
+_FALLBACK_MODE = DEFAULT_MODES["Gerçekçi"]
+
+
+@functools.lru_cache(maxsize=16)
 def get_mode_spec(mode_key: str) -> ModeSpec:
-    return DEFAULT_MODES.get(mode_key, DEFAULT_MODES["Gerçekçi"])
+    return DEFAULT_MODES.get(mode_key, _FALLBACK_MODE)
@@ -11,10 +11,32 @@ from __future__ import annotations
 import hashlib
 import json
 import random
+from json.encoder import encode_basestring
 from typing import Any
 
 
-def stable_int_seed(*parts: Any, salt: str = "startup-survivor") -> int:
+def _canonical_json(parts: tuple) -> str:
+    """json.dumps(parts, sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=str).
+
+    Seed parts are almost always ints and strs; those are encoded directly (same
+    output as json) and anything else falls back to json.dumps.
+    """
+    out = []
+    for p in parts:
+        t = type(p)
+        if t is int:
+            out.append(int.__repr__(p))
+        elif t is str:
+            out.append(encode_basestring(p))
+        else:
+            return json.dumps(parts, sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=str)
+    return "[" + ",".join(out) + "]"
+
+
+_SALT = "startup-survivor"
+
+
+def stable_int_seed(*parts: Any, salt: str = _SALT) -> int:
     """Return a stable 32-bit integer seed derived from arbitrary inputs.
 
     Uses SHA-256 over a canonical JSON representation of `parts`.
@@ -24,7 +46,7 @@ def stable_int_seed(*parts: Any, salt: str = "startup-survivor") -> int:
     - `default=str` ensures non-JSON types still serialize deterministically enough for our usage.
     - Output is 0..2**32-1 (works with random.Random).
     """
-    payload = json.dumps(parts, sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=str)
+    payload = _canonical_json(parts)
     h = hashlib.sha256((salt + "|" + payload).encode("utf-8")).digest()
     return int.from_bytes(h[:4], "big", signed=False)
 
@@ -33,3 +55,28 @@ def rng_from(*parts: Any, base_seed: int) -> random.Random:
     """Create a Random instance from (base_seed + parts)."""
     seed = stable_int_seed(base_seed, *parts)
     return random.Random(seed)
+
+
+def rng_prefix(*parts: Any, base_seed: int) -> "hashlib._Hash":
+    """Pre-hash the fixed leading parts of an rng_from() key.
+
+    Pass the result to rng_from_prefix() with the varying trailing parts; the
+    stream is identical to rng_from(*parts, *trailing, base_seed=base_seed).
+    JSON array elements are encoded independently, so the payload splits cleanly.
+    """
+    head = _canonical_json((base_seed, *parts))[:-1] + ","
+    return hashlib.sha256((_SALT + "|" + head).encode("utf-8"))
+
+
+def rng_from_prefix(prefix: "hashlib._Hash", *parts: Any) -> random.Random:
+    """Create a Random instance from a rng_prefix() state plus trailing parts.
+
+    At least one trailing part is required: the prefix already ends in the
+    array's "," separator, so an empty suffix would hash a malformed payload
+    that matches no rng_from() key. Use rng_from() when there is nothing to add.
+    """
+    if not parts:
+        raise ValueError("rng_from_prefix() needs at least one trailing part")
+    h = prefix.copy()
+    h.update(_canonical_json(parts)[1:].encode("utf-8"))
+    return random.Random(int.from_bytes(h.digest()[:4], "big", signed=False))
@@ -12,7 +12,7 @@ from dataclasses import asdict
 
 from .effects import (
     apply_case_bias,
-    apply_delta,
+    apply_deltas,
     due_delayed_effects,
     mode_adjustments,
     sample_delta,
@@ -33,22 +33,17 @@ def run_12_months_smoke() -> None:
 
     state = GameState(
         month=1,
-        stats=Stats(cash=1_000_000, mrr=0.0, reputation=50.0, support_load=20.0, infra_load=20.0, churn=0.05, morale=60.0, tech_debt=20.0),
+        stats=Stats(cash=1_000_000.0, mrr=0.0, reputation=50.0, support_load=20.0, infra_load=20.0, churn=0.05, morale=60.0, tech_debt=20.0),
         delayed_queue=[],
     )
 
     expenses_total = 61_400  # arbitrary fixed monthly expense baseline
 
     for m in range(1, 13):
-        # due delays first
         due, remaining = due_delayed_effects(state.delayed_queue, m)
-        stats = state.stats
-        for ev in due:
-            stats = apply_delta(stats, ev.delta)
 
         # monthly expense + optional macro
         macro = turkey_macro_cost(base_seed=base_seed, scenario_seed=scenario_seed, month=m) if spec.turkey else 0.0
-        stats = apply_delta(stats, {"cash": -(expenses_total + macro)})
 
         # choose alternating tags
         choice_key = "A" if m % 2 == 1 else "B"
@@ -61,7 +56,8 @@ def run_12_months_smoke() -> None:
         delta = mode_adjustments(delta, rng, mode_key, spec)
         delta = apply_case_bias(delta, case_key, tag, m)
 
-        stats = apply_delta(stats, delta)
+        # due delays, then expenses, then the choice: clamped in that order, one Stats
+        stats = apply_deltas(state.stats, [*(ev.delta for ev in due), {"cash": -(expenses_total + macro)}, delta])
 
         # schedule delayed
         new_queue = schedule_delayed_effect(
@@ -16,7 +16,7 @@ def clamp(x: float, lo: float, hi: float) -> float:
 Delta = Dict[str, float]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Stats:
     """Primary game metrics.
 
@@ -38,8 +38,22 @@ class Stats:
     morale: float            # 0..100
     tech_debt: float         # 0..100
 
-
-@dataclass(frozen=True)
+    def to_dict(self) -> Dict[str, float]:
+        # Fields are floats: apply_delta and stats_from_mapping produce floats, and
+        # every Stats literal in the codebase is written with float values.
+        return {
+            "cash": self.cash,
+            "mrr": self.mrr,
+            "reputation": self.reputation,
+            "support_load": self.support_load,
+            "infra_load": self.infra_load,
+            "churn": self.churn,
+            "morale": self.morale,
+            "tech_debt": self.tech_debt,
+        }
+
+
+@dataclass(frozen=True, slots=True)
 class DelayedEffect:
     """A delta that will apply at a future month."""
     due_month: int
@@ -48,7 +62,7 @@ class DelayedEffect:
     from_month: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GameState:
     """Minimal core state.
 
@@ -77,16 +91,7 @@ def stats_from_mapping(d: Mapping[str, float]) -> Stats:
 
 
 def stats_to_dict(s: Stats) -> Dict[str, float]:
-    return {
-        "cash": float(s.cash),
-        "mrr": float(s.mrr),
-        "reputation": float(s.reputation),
-        "support_load": float(s.support_load),
-        "infra_load": float(s.infra_load),
-        "churn": float(s.churn),
-        "morale": float(s.morale),
-        "tech_debt": float(s.tech_debt),
-    }
+    return s.to_dict()
 
 
 def default_start_state() -> GameState:
@@ -5,8 +5,9 @@ Engine configuration passed from UI.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict
+from dataclasses import dataclass, fields
+from functools import cached_property
+from typing import Any, Dict, Mapping
 
 
 @dataclass(frozen=True)
@@ -17,3 +18,20 @@ class EngineConfig:
     case_key: str
     expenses: Dict[str, float]
     season_length: int = 12
+
+    @cached_property
+    def expenses_total(self) -> float:
+        """Monthly expense total (expenses are fixed for a run).
+
+        A cached property, not a field, so asdict() exports stay importable.
+        """
+        return float(sum((self.expenses or {}).values()))
+
+    @classmethod
+    def from_dict(cls, d: Mapping[str, Any]) -> "EngineConfig":
+        """Rebuild from an asdict() export; unknown keys are ignored.
+
+        Exports written while expenses_total was a dataclass field carry that key.
+        """
+        names = {f.name for f in fields(cls) if f.init}
+        return cls(**{k: v for k, v in d.items() if k in names})
@@ -12,13 +12,12 @@ This layer is UI-agnostic.
 
 from __future__ import annotations
 
-from dataclasses import asdict
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, Iterable, List, Tuple
 
 from core.effects import (
     DelayedEffect,
     apply_case_bias,
-    apply_delta,
+    apply_deltas,
     due_delayed_effects,
     mode_adjustments,
     sample_delta,
@@ -26,8 +25,8 @@ from core.effects import (
     turkey_macro_cost,
 )
 from core.modes import get_mode_spec
-from core.rng import rng_from
-from core.state import GameState, stats_to_dict
+from core.rng import rng_from, rng_from_prefix, rng_prefix
+from core.state import GameState
 
 from content.schemas import (
     ChoiceIntent,
@@ -41,41 +40,43 @@ from content.schemas import (
 from .config import EngineConfig
 
 
-def _risk_tr(r: str) -> str:
-    return {"low": "Düşük", "med": "Orta", "high": "Yüksek"}.get(r, r)
+_RISK_TR = {"low": "Düşük", "med": "Orta", "high": "Yüksek"}
 
 
-def _steps_to_text(steps: List[str]) -> str:
-    return "\n".join([f"- {s}" for s in steps])
+def _steps_to_text(steps: Iterable[str]) -> str:
+    return "\n".join(map("- {}".format, steps))
 
 
 def draft_to_bundle(draft: MonthDraft, config: EngineConfig) -> MonthBundle:
     """Deterministically convert narrative draft into engine-ready MonthBundle."""
     spec = get_mode_spec(config.mode_key)
+    # Coerce config/draft scalars once; the per-option loop reuses them.
+    mid = int(draft.month_id)
+    base_seed = int(config.base_seed)
+    scenario_seed = int(config.scenario_seed)
+    swing = float(spec.swing)
+    choice_prefix = rng_prefix("choice", scenario_seed, mid, base_seed=base_seed)
 
     options: List[OptionSpec] = []
-    for opt in list(draft.options):
-        rng = rng_from(
-            "choice",
-            int(config.scenario_seed),
-            int(draft.month_id),
-            str(opt.id),
-            base_seed=int(config.base_seed),
-        )
-        delta = sample_delta(opt.tag, rng, swing=float(spec.swing))
+    for opt in draft.options:
+        oid = str(opt.id)
+        tag = str(opt.tag)
+        risk = str(opt.risk)
+        rng = rng_from_prefix(choice_prefix, oid)
+        delta = sample_delta(tag, rng, swing=swing)
         delta = mode_adjustments(delta, rng, config.mode_key, spec)
-        delta = apply_case_bias(delta, config.case_key, opt.tag, int(draft.month_id))
+        delta = apply_case_bias(delta, config.case_key, tag, mid)
 
         # delayed effect: reuse the deterministic scheduler, but convert into a spec list
         q0: List[DelayedEffect] = []
         q1 = schedule_delayed_effect(
             q0,
-            base_seed=int(config.base_seed),
-            scenario_seed=int(config.scenario_seed),
-            month=int(draft.month_id),
-            choice_key=str(opt.id),
-            tag=str(opt.tag),
-            risk=str(opt.risk),
+            base_seed=base_seed,
+            scenario_seed=scenario_seed,
+            month=mid,
+            choice_key=oid,
+            tag=tag,
+            risk=risk,
             seed_phrase=str(opt.delayed_seed),
             spec=spec,
         )
@@ -83,23 +84,23 @@ def draft_to_bundle(draft: MonthDraft, config: EngineConfig) -> MonthBundle:
         for ev in q1:
             delayed_specs.append(
                 DelayedEffectSpec(
-                    delay_months=int(ev.due_month) - int(draft.month_id),
+                    delay_months=int(ev.due_month) - mid,
                     delta=dict(ev.delta),
                     description=str(ev.hint or "Gecikmeli etki"),
                 )
             )
         desc = (
-            f"{_steps_to_text(list(opt.steps))}\n\n"
-            f"Risk: {_risk_tr(opt.risk)}\n"
-            f"Odak: {opt.tag}"
+            f"{_steps_to_text(opt.steps)}\n\n"
+            f"Risk: {_RISK_TR.get(risk, risk)}\n"
+            f"Odak: {tag}"
         )
 
         options.append(
             OptionSpec(
-                id=str(opt.id),
+                id=oid,
                 label=str(opt.title),
-                tag=str(opt.tag),
-                risk=str(opt.risk),
+                tag=tag,
+                risk=risk,
                 steps=list(opt.steps),
                 description=desc,
                 immediate_effects=dict(delta),
@@ -108,16 +109,16 @@ def draft_to_bundle(draft: MonthDraft, config: EngineConfig) -> MonthBundle:
             )
         )
 
-    title = (draft.month_title or f"Ay {int(draft.month_id)}: Karar Ayı").strip()
+    title = (draft.month_title or f"Ay {mid}: Karar Ayı").strip()
 
     bundle = MonthBundle(
-        month_id=int(draft.month_id),
+        month_id=mid,
         title=title,
         context=str(draft.durum_analizi),
         crisis_title=str(draft.kriz_title or "Kriz"),
         crisis=str(draft.kriz),
         options=options,
-        tags=[str(o.tag) for o in list(draft.options)],
+        tags=[o.tag for o in options],
         intensity=None,
         stakeholders=[],
         risk_notes=str(draft.note or ""),
@@ -148,35 +149,33 @@ def apply_choice(
 
     spec = get_mode_spec(config.mode_key)
 
-    before_stats = stats_to_dict(state.stats)
+    before_stats = state.stats.to_dict()
 
     # 1) due delayed effects
-    due, remaining = due_delayed_effects(list(state.delayed_queue), month)
-    s = state.stats
-    due_events: List[Dict[str, Any]] = []
-    for ev in due:
-        s = apply_delta(s, ev.delta)
-        due_events.append({"from_month": int(ev.from_month), "hint": str(ev.hint), "delta": dict(ev.delta)})
+    due, remaining = due_delayed_effects(state.delayed_queue, month)
+    due_events: List[Dict[str, Any]] = [
+        {"from_month": int(ev.from_month), "hint": str(ev.hint), "delta": ev.delta} for ev in due
+    ]
 
     # 2) expenses + optional TR macro
-    total_exp = float(sum((config.expenses or {}).values()))
+    total_exp = config.expenses_total
     macro_extra = float(turkey_macro_cost(base_seed=int(config.base_seed), scenario_seed=int(config.scenario_seed), month=month)) if spec.turkey else 0.0
-    s = apply_delta(s, {"cash": -(total_exp + macro_extra)})
 
     # 3) choice delta
-    opt = next((o for o in bundle.options if str(o.id) == str(choice_id)), None)
+    opt = bundle.get_option(str(choice_id))
     if opt is None:
         raise ValueError(f"Unknown choice_id: {choice_id}")
 
-    s = apply_delta(s, opt.immediate_effects)
+    # 1-3 applied in order (clamped after each), building one Stats
+    s = apply_deltas(state.stats, [*(ev.delta for ev in due), {"cash": -(total_exp + macro_extra)}, opt.immediate_effects])
 
     # 4) schedule delayed effects explicitly
-    q: List[DelayedEffect] = list(remaining)
-    for ds in list(opt.delayed_effects or []):
+    q: List[DelayedEffect] = remaining
+    for ds in opt.delayed_effects or ():
         q.append(
             DelayedEffect(
                 due_month=int(month) + int(ds.delay_months),
-                delta=dict(ds.delta),
+                delta=ds.delta,
                 hint=str(ds.description),
                 from_month=int(month),
             )
@@ -184,19 +183,19 @@ def apply_choice(
 
     new_state = GameState(month=month + 1, stats=s, delayed_queue=q)
 
-    after_stats = stats_to_dict(new_state.stats)
+    after_stats = new_state.stats.to_dict()
 
     log: Dict[str, Any] = {
         "month": month,
         "choice": str(choice_id),
         "choice_label": opt.label,
-        "before": dict(before_stats),
-        "after": dict(after_stats),
+        "before": before_stats,
+        "after": after_stats,
         "due_effects": due_events,
-        "expenses": float(total_exp),
-        "macro_extra": float(macro_extra),
-        "immediate_delta": dict(opt.immediate_effects),
-        "scheduled_delays": [asdict(ds) for ds in list(opt.delayed_effects or [])],
+        "expenses": total_exp,
+        "macro_extra": macro_extra,
+        "immediate_delta": opt.immediate_effects,
+        "scheduled_delays": [ds.to_dict() for ds in opt.delayed_effects or ()],
     }
     return new_state, log
 
@@ -213,20 +212,26 @@ def intent_to_option_spec(
     Economy remains deterministic: we only use intent.tag/risk/delayed_seed as signals.
     """
     spec = get_mode_spec(config.mode_key)
-    rng = rng_from("player-choice", int(config.scenario_seed), int(month_id), str(choice_id), base_seed=int(config.base_seed))
-    delta = sample_delta(str(intent.tag), rng, swing=float(spec.swing))
+    mid = int(month_id)
+    base_seed = int(config.base_seed)
+    scenario_seed = int(config.scenario_seed)
+    oid = str(choice_id)
+    tag = str(intent.tag)
+    risk = str(intent.risk)
+    rng = rng_from("player-choice", scenario_seed, mid, oid, base_seed=base_seed)
+    delta = sample_delta(tag, rng, swing=float(spec.swing))
     delta = mode_adjustments(delta, rng, config.mode_key, spec)
-    delta = apply_case_bias(delta, config.case_key, str(intent.tag), int(month_id))
+    delta = apply_case_bias(delta, config.case_key, tag, mid)
 
     q0: List[DelayedEffect] = []
     q1 = schedule_delayed_effect(
         q0,
-        base_seed=int(config.base_seed),
-        scenario_seed=int(config.scenario_seed),
-        month=int(month_id),
-        choice_key=str(choice_id),
-        tag=str(intent.tag),
-        risk=str(intent.risk),
+        base_seed=base_seed,
+        scenario_seed=scenario_seed,
+        month=mid,
+        choice_key=oid,
+        tag=tag,
+        risk=risk,
         seed_phrase=str(intent.delayed_seed),
         spec=spec,
     )
@@ -234,22 +239,22 @@ def intent_to_option_spec(
     for ev in q1:
         delayed_specs.append(
             DelayedEffectSpec(
-                delay_months=int(ev.due_month) - int(month_id),
+                delay_months=int(ev.due_month) - mid,
                 delta=dict(ev.delta),
                 description=str(ev.hint or "Gecikmeli etki"),
             )
         )
     desc = (
-        f"{_steps_to_text(list(intent.steps))}\n\n"
-        f"Risk: {_risk_tr(str(intent.risk))}\n"
-        f"Odak: {intent.tag}"
+        f"{_steps_to_text(intent.steps)}\n\n"
+        f"Risk: {_RISK_TR.get(risk, risk)}\n"
+        f"Odak: {tag}"
     )
 
     return OptionSpec(
-        id=str(choice_id),
+        id=oid,
         label=str(intent.title),
-        tag=str(intent.tag),
-        risk=str(intent.risk),
+        tag=tag,
+        risk=risk,
         steps=list(intent.steps),
         description=desc,
         immediate_effects=dict(delta),
@@ -271,49 +276,46 @@ def apply_option_spec(
     """
     spec = get_mode_spec(config.mode_key)
 
-    before_stats = stats_to_dict(state.stats)
+    before_stats = state.stats.to_dict()
 
     # 1) due delayed effects
-    due, remaining = due_delayed_effects(list(state.delayed_queue), int(month_id))
-    s = state.stats
-    due_events: List[Dict[str, Any]] = []
-    for ev in due:
-        s = apply_delta(s, ev.delta)
-        due_events.append({"from_month": int(ev.from_month), "hint": str(ev.hint), "delta": dict(ev.delta)})
+    due, remaining = due_delayed_effects(state.delayed_queue, int(month_id))
+    due_events: List[Dict[str, Any]] = [
+        {"from_month": int(ev.from_month), "hint": str(ev.hint), "delta": ev.delta} for ev in due
+    ]
 
     # 2) expenses + optional TR macro
-    total_exp = float(sum((config.expenses or {}).values()))
+    total_exp = config.expenses_total
     macro_extra = float(turkey_macro_cost(base_seed=int(config.base_seed), scenario_seed=int(config.scenario_seed), month=int(month_id))) if spec.turkey else 0.0
-    s = apply_delta(s, {"cash": -(total_exp + macro_extra)})
 
-    # 3) option delta
-    s = apply_delta(s, option.immediate_effects)
+    # 3) option delta; 1-3 applied in order (clamped after each), building one Stats
+    s = apply_deltas(state.stats, [*(ev.delta for ev in due), {"cash": -(total_exp + macro_extra)}, option.immediate_effects])
 
     # 4) schedule delayed effects explicitly
-    q: List[DelayedEffect] = list(remaining)
-    for ds in list(option.delayed_effects or []):
+    q: List[DelayedEffect] = remaining
+    for ds in option.delayed_effects or ():
         q.append(
             DelayedEffect(
                 due_month=int(month_id) + int(ds.delay_months),
-                delta=dict(ds.delta),
+                delta=ds.delta,
                 hint=str(ds.description),
                 from_month=int(month_id),
             )
         )
 
     new_state = GameState(month=int(month_id) + 1, stats=s, delayed_queue=q)
-    after_stats = stats_to_dict(new_state.stats)
+    after_stats = new_state.stats.to_dict()
 
     log: Dict[str, Any] = {
         "month": int(month_id),
         "choice": str(option.id),
         "choice_label": option.label,
-        "before": dict(before_stats),
-        "after": dict(after_stats),
+        "before": before_stats,
+        "after": after_stats,
         "due_effects": due_events,
-        "expenses": float(total_exp),
-        "macro_extra": float(macro_extra),
-        "immediate_delta": dict(option.immediate_effects),
-        "scheduled_delays": [asdict(ds) for ds in list(option.delayed_effects or [])],
+        "expenses": total_exp,
+        "macro_extra": macro_extra,
+        "immediate_delta": option.immediate_effects,
+        "scheduled_delays": [ds.to_dict() for ds in option.delayed_effects or ()],
     }
     return new_state, log
@@ -0,0 +1,42 @@
+"""
+engine.selfcheck
+Minimal "it runs" proof for the engine layer.
+
+Run:
+  python -m engine.selfcheck
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import asdict
+
+from .config import EngineConfig
+
+
+def config_export_roundtrip() -> None:
+    cfg = EngineConfig(
+        base_seed=42,
+        scenario_seed=2019,
+        mode_key="Gerçekçi",
+        case_key="free",
+        expenses={"payroll": 50_000.0, "infra": 6_100.0, "marketing": 5_300.0},
+        season_length=12,
+    )
+    total = cfg.expenses_total  # populate the cache; it must not leak into the export
+
+    # Same path as the app's run export/import: asdict -> JSON -> from_dict
+    exported = json.loads(json.dumps(asdict(cfg)))
+    assert "expenses_total" not in exported
+    back = EngineConfig.from_dict(exported)
+    assert back == cfg
+    assert back.expenses_total == total
+
+    # Files exported while expenses_total was a dataclass field still import
+    assert EngineConfig.from_dict({**exported, "expenses_total": total}) == cfg
+
+    print("OK: EngineConfig export/import round-trip passed.")
+
+
+if __name__ == "__main__":
+    config_export_roundtrip()
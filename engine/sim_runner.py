@@ -18,6 +18,66 @@ from .config import EngineConfig
 from .pipeline import apply_choice, draft_to_bundle
 
 
+# Fake month content is identical every month except id/title: build it once.
+_FAKE_DURUM = (
+    "Bu ayın genel resmi: talep var ama sistem sınırda. "
+    "Doğru hamleyle hızlanırsın; yanlış hamleyle yük birikir ve kalite algısı kırılır. "
+    "Kısa vadeli kazanım ile uzun vadeli sağlamlık arasında seçim yapman gerekecek. "
+    "Ekip motivasyonu ve müşteri güveni aynı anda etkilenebilir. "
+    "Odak dağıtırsan küçük sorunlar birleşip büyük krize dönüşebilir. "
+    * 4
+)[:520]
+
+_FAKE_KRIZ = (
+    "Rakipler agresif kampanya açtı ve kullanıcılar alternatifleri deniyor. "
+    "Şikâyetler artarsa hem itibar hem gelir aynı anda zarar görür. "
+    "Bu ay tek kritik iş: büyüme atağını mı basacaksın yoksa sistemi sadeleştirip dayanıklılığı mı artıracaksın? "
+    * 4
+)[:520]
+
+_FAKE_OPTIONS: Tuple[OptionDraft, ...] = (
+    OptionDraft(
+        id="A",
+        title="Tek kanala yüklen",
+        tag="growth",
+        steps=[
+            "En hızlı kanalı seç ve tek mesajla agresif test yap",
+            "Landing + onboarding'i sadeleştir",
+            "1 metrikte kazan-kaybet hedefi koy",
+            "Hızlı iterasyon takvimi çıkar",
+        ],
+        risk="med",
+        delayed_seed="kısa vadeli ivme",
+        result=(
+            "Kısa sürede görünürlük artar ve pipeline hareketlenir. "
+            "Ama yük birikirse ekip yangın söndürmeye kayabilir; müşteri deneyimi hassaslaşır."
+        ),
+    ),
+    OptionDraft(
+        id="B",
+        title="Sistemi güçlendir",
+        tag="reliability",
+        steps=[
+            "En büyük 2 darboğazı seç ve fix listesi çıkar",
+            "On-call / destek sürecini netleştir",
+            "Kritik metrikler için alarmları ayarla",
+            "Release disiplinini sıkılaştır",
+        ],
+        risk="low",
+        delayed_seed="temiz altyapı",
+        result=(
+            "Görünür büyüme yavaşlar ama sistem nefes alır. "
+            "Şikâyetler azalır; itibar ve churn kontrol altına girer."
+        ),
+    ),
+)
+
+_FAKE_ALTERNATIVES: Tuple[str, ...] = (
+    "Büyüme kanalını kıs, ama onboarding'in en kritik 1 adımını iyileştir.",
+    "Destek yükünü azaltmak için tek bir self-serve çözüm yayınla.",
+)
+
+
 @dataclass
 class FakeDraftProvider:
     """Deterministic provider for tests (no LLM)."""
@@ -26,62 +86,12 @@ class FakeDraftProvider:
         return MonthDraft(
             month_id=month_id,
             month_title=f"Ay {month_id}: Test Dönemeç",
-            durum_analizi=(
-                "Bu ayın genel resmi: talep var ama sistem sınırda. "
-                "Doğru hamleyle hızlanırsın; yanlış hamleyle yük birikir ve kalite algısı kırılır. "
-                "Kısa vadeli kazanım ile uzun vadeli sağlamlık arasında seçim yapman gerekecek. "
-                "Ekip motivasyonu ve müşteri güveni aynı anda etkilenebilir. "
-                "Odak dağıtırsan küçük sorunlar birleşip büyük krize dönüşebilir. "
-                * 4
-            )[:520],
+            durum_analizi=_FAKE_DURUM,
             kriz_title="Rakip baskısı",
-            kriz=(
-                "Rakipler agresif kampanya açtı ve kullanıcılar alternatifleri deniyor. "
-                "Şikâyetler artarsa hem itibar hem gelir aynı anda zarar görür. "
-                "Bu ay tek kritik iş: büyüme atağını mı basacaksın yoksa sistemi sadeleştirip dayanıklılığı mı artıracaksın? "
-                * 4
-            )[:520],
-            options=[
-                OptionDraft(
-                    id="A",
-                    title="Tek kanala yüklen",
-                    tag="growth",
-                    steps=[
-                        "En hızlı kanalı seç ve tek mesajla agresif test yap",
-                        "Landing + onboarding'i sadeleştir",
-                        "1 metrikte kazan-kaybet hedefi koy",
-                        "Hızlı iterasyon takvimi çıkar",
-                    ],
-                    risk="med",
-                    delayed_seed="kısa vadeli ivme",
-                    result=(
-                        "Kısa sürede görünürlük artar ve pipeline hareketlenir. "
-                        "Ama yük birikirse ekip yangın söndürmeye kayabilir; müşteri deneyimi hassaslaşır."
-                    ),
-                ),
-                OptionDraft(
-                    id="B",
-                    title="Sistemi güçlendir",
-                    tag="reliability",
-                    steps=[
-                        "En büyük 2 darboğazı seç ve fix listesi çıkar",
-                        "On-call / destek sürecini netleştir",
-                        "Kritik metrikler için alarmları ayarla",
-                        "Release disiplinini sıkılaştır",
-                    ],
-                    risk="low",
-                    delayed_seed="temiz altyapı",
-                    result=(
-                        "Görünür büyüme yavaşlar ama sistem nefes alır. "
-                        "Şikâyetler azalır; itibar ve churn kontrol altına girer."
-                    ),
-                ),
-            ],
+            kriz=_FAKE_KRIZ,
+            options=list(_FAKE_OPTIONS),
             lesson="Büyüme mi dayanıklılık mı? Seçim, gelecekteki yangınların sayısını belirler.",
-            alternatives=[
-                "Büyüme kanalını kıs, ama onboarding'in en kritik 1 adımını iyileştir.",
-                "Destek yükünü azaltmak için tek bir self-serve çözüm yayınla.",
-            ],
+            alternatives=list(_FAKE_ALTERNATIVES),
             cliffhanger="Rakip yeni bir fiyat kırma hamlesi sinyali veriyor…",
         )
 
@@ -96,7 +106,7 @@ def run_headless_sim(months: int = 12) -> Dict[str, Any]:
         expenses={"payroll": 120_000, "infra": 25_000, "misc": 15_000},
     )
 
-    state = GameState(month=1, stats=Stats(cash=550_000, mrr=900, reputation=50, support_load=22, infra_load=22, churn=0.055, morale=58, tech_debt=22), delayed_queue=[])
+    state = GameState(month=1, stats=Stats(cash=550_000.0, mrr=900.0, reputation=50.0, support_load=22.0, infra_load=22.0, churn=0.055, morale=58.0, tech_debt=22.0), delayed_queue=[])
 
     provider = FakeDraftProvider()
     logs: List[Dict[str, Any]] = []
@@ -6,13 +6,17 @@ from __future__ import annotations
 
 import json
 import ast
+import hashlib
+import importlib.util
 import os
 import random
 import re
+import threading
 from dataclasses import dataclass
 from datetime import datetime
 from html import escape as html_escape
-from typing import Any, Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Set, Tuple
 
 import streamlit as st
 
@@ -133,15 +137,42 @@ def ensure_list(x: Any) -> List[Any]:
         return x
     return [x]
 
+_CODE_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)```", re.DOTALL | re.IGNORECASE)
+_TRAILING_COMMA_RE = re.compile(r",\s*([}\]])")
+# JSON literals -> Python literals for the ast.literal_eval fallback (one pass).
+_JSON_LITERAL_RE = re.compile(r"\b(null|true|false)\b", re.IGNORECASE)
+_PY_LITERALS = {"null": "None", "true": "True", "false": "False"}
+
+
 def strip_code_fences(s: str) -> str:
     s = (s or "").strip()
     # ```json ... ```
-    m = re.search(r"```(?:json)?\s*(.*?)```", s, re.DOTALL | re.IGNORECASE)
+    m = _CODE_FENCE_RE.search(s)
     if m:
         return m.group(1).strip()
     return s
 
 
+# A quoted span ("..." or '...'); an unterminated one runs to the end of the text.
+_QUOTED_STRING_RE = re.compile(
+    r'"[^"\\]*(?:\\.[^"\\]*)*(?:"|\\?\Z)'
+    r"|'[^'\\]*(?:\\.[^'\\]*)*(?:'|\\?\Z)",
+    re.DOTALL,
+)
+_STRING_NEWLINE_RE = re.compile(r"\\.|[\r\n]", re.DOTALL)
+_NEWLINE_ESCAPES = {"\n": "\\n", "\r": "\\r"}
+
+
+def _escape_string_newlines(m: "re.Match[str]") -> str:
+    body = m.group(0)
+    if "\n" not in body and "\r" not in body:
+        return body
+    if "\\" not in body:
+        return body.replace("\n", "\\n").replace("\r", "\\r")
+    # Walk escape pairs so an escaped newline (backslash + newline) is left as-is.
+    return _STRING_NEWLINE_RE.sub(lambda t: _NEWLINE_ESCAPES.get(t.group(0), t.group(0)), body)
+
+
 def escape_newlines_in_json_strings(s: str) -> str:
     """Escape bare newlines inside quoted strings.
 
@@ -150,40 +181,7 @@ def escape_newlines_in_json_strings(s: str) -> str:
     """
     if not s:
         return s
-    out: List[str] = []
-    in_str = False
-    quote = ""
-    esc = False
-    for ch in s:
-        if in_str:
-            if esc:
-                out.append(ch)
-                esc = False
-                continue
-            if ch == "\\":  # start escape
-                out.append(ch)
-                esc = True
-                continue
-            if ch == quote:
-                out.append(ch)
-                in_str = False
-                quote = ""
-                continue
-            if ch == "\n":
-                out.append("\\n")
-                continue
-            if ch == "\r":
-                out.append("\\r")
-                continue
-            out.append(ch)
-        else:
-            if ch in ('"', "'"):
-                out.append(ch)
-                in_str = True
-                quote = ch
-            else:
-                out.append(ch)
-    return "".join(out)
+    return _QUOTED_STRING_RE.sub(_escape_string_newlines, s)
 
 def try_parse_json(raw: str) -> Optional[dict]:
     """Best-effort JSON parser for LLM outputs.
@@ -216,7 +214,7 @@ def try_parse_json(raw: str) -> Optional[dict]:
     s = "".join(ch for ch in s if (ch >= " " or ch in "\n\r\t"))
 
     # Fix trailing commas
-    s = re.sub(r",\s*([}\]])", r"\1", s)
+    s = _TRAILING_COMMA_RE.sub(r"\1", s)
 
 
     # Escape bare newlines inside quoted strings (LLM outputs can violate JSON)
@@ -231,9 +229,7 @@ def try_parse_json(raw: str) -> Optional[dict]:
 
     # Second attempt: Python literal (single quotes etc.)
     try:
-        py = re.sub(r"\bnull\b", "None", s, flags=re.IGNORECASE)
-        py = re.sub(r"\btrue\b", "True", py, flags=re.IGNORECASE)
-        py = re.sub(r"\bfalse\b", "False", py, flags=re.IGNORECASE)
+        py = _JSON_LITERAL_RE.sub(lambda m: _PY_LITERALS[m.group(1).lower()], s)
         obj = ast.literal_eval(py)
         return obj if isinstance(obj, dict) else None
     except Exception:
@@ -285,29 +281,33 @@ def normalize_risk(x: Any) -> str:
         return "high"
     return "med"
 
+TAG_LABELS = {
+    "growth":"Büyüme",
+    "efficiency":"Verimlilik",
+    "reliability":"Dayanıklılık",
+    "compliance":"Uyum/Hukuk",
+    "fundraising":"Yatırım/Finansman",
+    "people":"Ekip/İK",
+    "product":"Ürün",
+    "sales":"Satış",
+    "marketing":"Pazarlama",
+    "security":"Güvenlik",
+}
+
+RISK_LABELS = {"low":"Düşük risk", "med":"Orta risk", "high":"Yüksek risk"}
+
 def tag_label(tag: str) -> str:
-    return {
-        "growth":"Büyüme",
-        "efficiency":"Verimlilik",
-        "reliability":"Dayanıklılık",
-        "compliance":"Uyum/Hukuk",
-        "fundraising":"Yatırım/Finansman",
-        "people":"Ekip/İK",
-        "product":"Ürün",
-        "sales":"Satış",
-        "marketing":"Pazarlama",
-        "security":"Güvenlik",
-    }.get(tag, tag)
+    return TAG_LABELS.get(tag, tag)
 
 def risk_label(r: str) -> str:
-    return {"low":"Düşük risk", "med":"Orta risk", "high":"Yüksek risk"}.get(r, r)
+    return RISK_LABELS.get(r, r)
 
 
 # =========================
 # True Story cases
 # =========================
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CaseSeason:
     key: str
     title: str
@@ -315,13 +315,10 @@ class CaseSeason:
     blurb: str
     seed: int
     inspired_by: str
-    sources: List[Tuple[str, str]]
-    real_outcome: List[str]
-
-def _src(title: str, url: str) -> Tuple[str, str]:
-    return (title, url)
+    sources: Tuple[Tuple[str, str], ...]
+    real_outcome: Tuple[str, ...]
 
-CASE_LIBRARY: List[CaseSeason] = [
+CASE_LIBRARY: Tuple[CaseSeason, ...] = (
     CaseSeason(
         key="free",
         title="Serbest (Rastgele)",
@@ -329,8 +326,8 @@ CASE_LIBRARY: List[CaseSeason] = [
         blurb="Kendi fikrine göre rastgele olaylar. Her ay farklı kriz.",
         seed=1,
         inspired_by="",
-        sources=[],
-        real_outcome=[],
+        sources=(),
+        real_outcome=(),
     ),
 
     # 10 True Story cases
@@ -341,13 +338,13 @@ CASE_LIBRARY: List[CaseSeason] = [
         blurb="Mahremiyet krizi büyür; regülatör baskısı ve toplu davalar iş modelini sıkıştırır.",
         seed=2019,
         inspired_by="Facebook/FTC gizlilik uzlaşması dinamiği",
-        sources=[
-            _src("FTC press release (2019) — Facebook privacy restrictions", "https://www.ftc.gov/news-events/news/press-releases/2019/07/ftc-imposes-5-billion-penalty-sweeping-new-privacy-restrictions-facebook"),
-        ],
-        real_outcome=[
+        sources=(
+            ("FTC press release (2019) — Facebook privacy restrictions", "https://www.ftc.gov/news-events/news/press-releases/2019/07/ftc-imposes-5-billion-penalty-sweeping-new-privacy-restrictions-facebook"),
+        ),
+        real_outcome=(
             "ABD FTC, 2019'da Facebook'a 5 milyar $ ceza ve kapsamlı gizlilik yükümlülükleri getirdi.",
             "Şirketin gizlilik programı ve yönetim düzeyinde sorumluluk mekanizmaları güçlendirildi.",
-        ],
+        ),
     ),
     CaseSeason(
         key="wework_ipo_2019",
@@ -356,13 +353,13 @@ CASE_LIBRARY: List[CaseSeason] = [
         blurb="Hiper büyüme, nakit yakımı ve yönetişim sorunları halka arzı çökertir.",
         seed=2019_2,
         inspired_by="WeWork 2019 IPO süreci dinamiği",
-        sources=[
-            _src("Business Wire (2019) — WeWork withdraws S‑1", "https://www.businesswire.com/news/home/20190930005559/en/WeWork-Withdraw-S-1-Registration-Statement"),
-        ],
-        real_outcome=[
+        sources=(
+            ("Business Wire (2019) — WeWork withdraws S‑1", "https://www.businesswire.com/news/home/20190930005559/en/WeWork-Withdraw-S-1-Registration-Statement"),
+        ),
+        real_outcome=(
             "WeWork 30 Eylül 2019'da S‑1 kayıt beyanını geri çektiğini duyurdu.",
             "Ardından yeniden yapılanma ve finansman arayışı gündeme geldi.",
-        ],
+        ),
     ),
     CaseSeason(
         key="blackberry_platform_shift",
@@ -371,14 +368,14 @@ CASE_LIBRARY: List[CaseSeason] = [
         blurb="Ürün kaliteli olsa da ekosistem/pazar standardı değişir; platform kayması boğar.",
         seed=2007,
         inspired_by="BlackBerry'nin platform kayması ve dönüşümü dinamiği",
-        sources=[
-            _src("Platform Digit — Rise/Fall of BlackBerry", "https://d3.harvard.edu/platform-digit/submission/the-rise-and-fall-and-rise-again-of-blackberry/"),
-            _src("WIRED (2016) — BlackBerry handsets shift (context)", "https://www.wired.com/story/blackberry-stop-making-handsets/"),
-        ],
-        real_outcome=[
+        sources=(
+            ("Platform Digit — Rise/Fall of BlackBerry", "https://d3.harvard.edu/platform-digit/submission/the-rise-and-fall-and-rise-again-of-blackberry/"),
+            ("WIRED (2016) — BlackBerry handsets shift (context)", "https://www.wired.com/story/blackberry-stop-making-handsets/"),
+        ),
+        real_outcome=(
             "Akıllı telefon pazarı uygulama ekosistemi ve UX standardı etrafında hızla değişti.",
             "BlackBerry 2016'da donanım odağını bırakıp yazılım/servislere daha fazla yöneldi.",
-        ],
+        ),
     ),
     CaseSeason(
         key="samsung_note7_recall",
@@ -387,13 +384,13 @@ CASE_LIBRARY: List[CaseSeason] = [
         blurb="Safety krizi geri çağırma dalgasına dönüşür; nakit, itibar ve operasyon aynı anda yanar.",
         seed=2016,
         inspired_by="Galaxy Note7 geri çağırma dinamiği",
-        sources=[
-            _src("US CPSC recall notice (2016)", "https://www.cpsc.gov/Recalls/2016/Samsung-Recalls-Galaxy-Note7-Smartphones"),
-        ],
-        real_outcome=[
+        sources=(
+            ("US CPSC recall notice (2016)", "https://www.cpsc.gov/Recalls/2016/Samsung-Recalls-Galaxy-Note7-Smartphones"),
+        ),
+        real_outcome=(
             "2016'da ürün güvenliği riski nedeniyle geniş kapsamlı geri çağırma ve üretim durdurma adımları atıldı.",
             "Maliyet, itibar ve tedarik zinciri baskısı aynı anda yönetilmek zorunda kaldı.",
-        ],
+        ),
     ),
     CaseSeason(
         key="uber_2017_crisis",
@@ -402,13 +399,13 @@ CASE_LIBRARY: List[CaseSeason] = [
         blurb="Davalar, kamuoyu ve kültür sorunları birleşir; yönetim krizi büyümeyi tehdit eder.",
         seed=2017,
         inspired_by="Uber 2017 kriz zinciri dinamiği",
-        sources=[
-            _src("TIME (2017) — Kalanick resigns", "https://time.com/4826194/uber-travis-kalanick-resigns/"),
-        ],
-        real_outcome=[
+        sources=(
+            ("TIME (2017) — Kalanick resigns", "https://time.com/4826194/uber-travis-kalanick-resigns/"),
+        ),
+        real_outcome=(
             "2017'de şirket içi kültür ve kamuoyu baskısı liderlik krizine dönüştü.",
             "Üst yönetim değişiklikleri ve itibar onarımı gündeme geldi.",
-        ],
+        ),
     ),
     CaseSeason(
         key="equifax_breach_settlement",
@@ -417,13 +414,13 @@ CASE_LIBRARY: List[CaseSeason] = [
         blurb="Data breach sonrası güven çöküşü; regülatör ve tazminat maliyeti şirketi sıkıştırır.",
         seed=2017_2,
         inspired_by="Equifax 2017 ihlali sonrası settlement dinamiği",
-        sources=[
-            _src("FTC (2019) — Equifax settlement", "https://www.ftc.gov/news-events/news/press-releases/2019/07/equifax-pay-575-million-part-settlement-ftc-cfpb-states-related-2017-data-breach"),
-        ],
-        real_outcome=[
+        sources=(
+            ("FTC (2019) — Equifax settlement", "https://www.ftc.gov/news-events/news/press-releases/2019/07/equifax-pay-575-million-part-settlement-ftc-cfpb-states-related-2017-data-breach"),
+        ),
+        real_outcome=(
             "Equifax 2017 ihlali sonrası FTC/CFPB/eyaletlerle 2019'da kapsamlı settlement duyuruldu.",
             "Güven onarımı, güvenlik programı ve mali tazminat baskısı birlikte yönetildi.",
-        ],
+        ),
     ),
     CaseSeason(
         key="vw_dieselgate",
@@ -432,13 +429,13 @@ CASE_LIBRARY: List[CaseSeason] = [
         blurb="Uyum ihlali büyük cezaya dönüşür; hukuk, itibar, operasyon aynı anda krize girer.",
         seed=2015,
         inspired_by="Volkswagen Dieselgate dinamiği",
-        sources=[
-            _src("US DOJ (2017) — Volkswagen plea and penalties", "https://www.justice.gov/archives/opa/pr/volkswagen-ag-agrees-plead-guilty-and-pay-43-billion-criminal-and-civil-penalties-six"),
-        ],
-        real_outcome=[
+        sources=(
+            ("US DOJ (2017) — Volkswagen plea and penalties", "https://www.justice.gov/archives/opa/pr/volkswagen-ag-agrees-plead-guilty-and-pay-43-billion-criminal-and-civil-penalties-six"),
+        ),
+        real_outcome=(
             "Skandal sonrası milyarlarca $ ceza/uzlaşma ve kapsamlı uyum yükümlülükleri gündeme geldi.",
             "Şirketin uyum ve itibar onarımı uzun soluklu bir dönüşüm sürecine dönüştü.",
-        ],
+        ),
     ),
     CaseSeason(
         key="boeing_737max_grounding",
@@ -447,13 +444,13 @@ CASE_LIBRARY: List[CaseSeason] = [
         blurb="Ürün güvenliği ve kamu baskısı operasyonu durdurmaya kadar gider; sert regülasyon devreye girer.",
         seed=2019_3,
         inspired_by="Boeing 737 MAX grounding dinamiği",
-        sources=[
-            _src("US DOT (2019) — Temporary grounding statement", "https://www.transportation.gov/briefing-room/statement-temporary-grounding-boeing-737-max-aircraft-operated-us-airlines-or-us"),
-        ],
-        real_outcome=[
+        sources=(
+            ("US DOT (2019) — Temporary grounding statement", "https://www.transportation.gov/briefing-room/statement-temporary-grounding-boeing-737-max-aircraft-operated-us-airlines-or-us"),
+        ),
+        real_outcome=(
             "2019'da 737 MAX uçuşları birçok otorite tarafından geçici olarak durduruldu (grounding).",
             "Güvenlik, sertifikasyon ve itibar boyutu aynı anda ele alındı.",
-        ],
+        ),
     ),
     CaseSeason(
         key="wells_fargo_accounts",
@@ -462,13 +459,13 @@ CASE_LIBRARY: List[CaseSeason] = [
         blurb="Hedef baskısı yanlış teşvikler doğurur; uyum ve itibar krizi patlar.",
         seed=2016_2,
         inspired_by="Wells Fargo unauthorized accounts dinamiği",
-        sources=[
-            _src("CFPB enforcement (2016) — Wells Fargo", "https://www.consumerfinance.gov/enforcement/actions/wells-fargo-bank-2016/"),
-        ],
-        real_outcome=[
+        sources=(
+            ("CFPB enforcement (2016) — Wells Fargo", "https://www.consumerfinance.gov/enforcement/actions/wells-fargo-bank-2016/"),
+        ),
+        real_outcome=(
             "2016'da izinsiz hesap açma iddiaları sonrası düzenleyici yaptırımlar gündeme geldi.",
             "Teşvik sistemi, kültür ve uyum programları yeniden ele alındı.",
-        ],
+        ),
     ),
     CaseSeason(
         key="deepwater_horizon",
@@ -477,83 +474,94 @@ CASE_LIBRARY: List[CaseSeason] = [
         blurb="Operasyon felaketi, uzun soluklu hukuk ve tazminat yüküne dönüşür; şirket sarsılır.",
         seed=2010,
         inspired_by="Deepwater Horizon sonrası settlement dinamiği",
-        sources=[
-            _src("US DOJ (2015) — BP historic settlement", "https://www.justice.gov/archives/opa/pr/us-and-five-gulf-states-reach-historic-settlement-bp-resolve-civil-lawsuit-over-deepwater"),
-        ],
-        real_outcome=[
+        sources=(
+            ("US DOJ (2015) — BP historic settlement", "https://www.justice.gov/archives/opa/pr/us-and-five-gulf-states-reach-historic-settlement-bp-resolve-civil-lawsuit-over-deepwater"),
+        ),
+        real_outcome=(
             "2015'te ABD ve Gulf eyaletleriyle büyük bir uzlaşma açıklandı; tazminat ve ceza yükü büyüktü.",
             "Operasyon güvenliği ve risk yönetimi şirket stratejisinin merkezine oturdu.",
-        ],
+        ),
     ),
-]
+)
+
+_CASE_BY_KEY: Dict[str, CaseSeason] = {c.key: c for c in CASE_LIBRARY}
 
 def get_case(case_key: str) -> CaseSeason:
-    for c in CASE_LIBRARY:
-        if c.key == case_key:
-            return c
-    return CASE_LIBRARY[0]
+    return _CASE_BY_KEY.get(case_key, CASE_LIBRARY[0])
 
 
 # =========================
 # Modes / Difficulty
 # =========================
 
-MODES: Dict[str, Dict[str, Any]] = {
-    "Gerçekçi": {
-        "desc": "Tam gerçek dünya hissi. Trade-off net, mucize yok.",
-        "temp": 0.75,
-        "swing": 1.00,
-        "tone": "tamamen gerçekçi, operatif, net; abartı yok; ölçülü dramatik",
-        "require_reason": False,
-        "deceptive": False,
-        "antagonistic": False,
-        "turkey": False,
-        "absurd": False,
-    },
-    "Zor": {
-        "desc": "Gerçekçi ama daha zor. Seçenekler yanıltıcı olabilir; kısa gerekçe yazmanı ister.",
-        "temp": 0.82,
-        "swing": 1.25,
-        "tone": "sert ama adil; belirsizlik yüksek; hızlı karar baskısı",
-        "require_reason": True,
-        "deceptive": True,
-        "antagonistic": False,
-        "turkey": False,
-        "absurd": False,
-    },
-    "Spartan": {
-        "desc": "En zor. Anlatıcı antagonistik; dünya acımasız ama mantıklı.",
-        "temp": 0.88,
-        "swing": 1.45,
-        "tone": "acımasız derecede gerçekçi; iğneleyici ama saygılı; baskı çok yüksek",
-        "require_reason": True,
-        "deceptive": True,
-        "antagonistic": True,
-        "turkey": False,
-        "absurd": False,
-    },
-    "Türkiye": {
-        "desc": "Türkiye şartları: kur/enflasyon, vergi/SGK, denetimler, tahsilat gecikmesi, afet riski.",
-        "temp": 0.78,
-        "swing": 1.10,
-        "tone": "Türkiye iş dünyası gerçekleri; maliyet ve uyum detaylı; somut ve gerçekçi",
-        "require_reason": False,
-        "deceptive": False,
-        "antagonistic": False,
-        "turkey": True,
-        "absurd": False,
-    },
-    "Extreme": {
-        "desc": "Absürt ve komik. Mantıksız ama eğlenceli krizler (sadece bu modda).",
-        "temp": 1.05,
-        "swing": 1.40,
-        "tone": "yüksek tempo, absürt mizah, şaşırtıcı ve yaratıcı",
-        "require_reason": False,
-        "deceptive": False,
-        "antagonistic": False,
-        "turkey": False,
-        "absurd": True,
-    },
+@dataclass(frozen=True, slots=True)
+class ModeSpec:
+    desc: str
+    temp: float
+    swing: float
+    tone: str
+    require_reason: bool
+    deceptive: bool
+    antagonistic: bool
+    turkey: bool
+    absurd: bool
+
+MODES: Dict[str, ModeSpec] = {
+    "Gerçekçi": ModeSpec(
+        desc="Tam gerçek dünya hissi. Trade-off net, mucize yok.",
+        temp=0.75,
+        swing=1.00,
+        tone="tamamen gerçekçi, operatif, net; abartı yok; ölçülü dramatik",
+        require_reason=False,
+        deceptive=False,
+        antagonistic=False,
+        turkey=False,
+        absurd=False,
+    ),
+    "Zor": ModeSpec(
+        desc="Gerçekçi ama daha zor. Seçenekler yanıltıcı olabilir; kısa gerekçe yazmanı ister.",
+        temp=0.82,
+        swing=1.25,
+        tone="sert ama adil; belirsizlik yüksek; hızlı karar baskısı",
+        require_reason=True,
+        deceptive=True,
+        antagonistic=False,
+        turkey=False,
+        absurd=False,
+    ),
+    "Spartan": ModeSpec(
+        desc="En zor. Anlatıcı antagonistik; dünya acımasız ama mantıklı.",
+        temp=0.88,
+        swing=1.45,
+        tone="acımasız derecede gerçekçi; iğneleyici ama saygılı; baskı çok yüksek",
+        require_reason=True,
+        deceptive=True,
+        antagonistic=True,
+        turkey=False,
+        absurd=False,
+    ),
+    "Türkiye": ModeSpec(
+        desc="Türkiye şartları: kur/enflasyon, vergi/SGK, denetimler, tahsilat gecikmesi, afet riski.",
+        temp=0.78,
+        swing=1.10,
+        tone="Türkiye iş dünyası gerçekleri; maliyet ve uyum detaylı; somut ve gerçekçi",
+        require_reason=False,
+        deceptive=False,
+        antagonistic=False,
+        turkey=True,
+        absurd=False,
+    ),
+    "Extreme": ModeSpec(
+        desc="Absürt ve komik. Mantıksız ama eğlenceli krizler (sadece bu modda).",
+        temp=1.05,
+        swing=1.40,
+        tone="yüksek tempo, absürt mizah, şaşırtıcı ve yaratıcı",
+        require_reason=False,
+        deceptive=False,
+        antagonistic=False,
+        turkey=False,
+        absurd=True,
+    ),
 }
 
 
@@ -561,25 +569,65 @@ MODES: Dict[str, Dict[str, Any]] = {
 # Gemini wrapper (new SDK + legacy fallback)
 # =========================
 
-@dataclass
+# Candidate model names, tried in order (first one is preferred).
+_TEXT_MODEL_CANDIDATES: Tuple[str, ...] = (
+    "gemini-2.5-pro",
+    "gemini-2.5-flash",
+    "gemini-3-flash-preview",
+    "gemini-2.0-flash",
+    "gemini-1.5-flash",
+    "gemini-1.5-pro",
+)
+_JSON_MODEL_CANDIDATES: Tuple[str, ...] = (
+    "gemini-2.5-pro",
+    "gemini-2.5-pro-latest",
+    "gemini-2.5-flash",
+    "gemini-2.0-flash",
+    "gemini-1.5-pro",
+)
+
+@dataclass(slots=True)
 class LLMStatus:
     ok: bool
     backend: str  # "genai" | "legacy" | "none"
     model: str
     note: str
 
+def _module_available(name: str) -> bool:
+    """True if `name` can be imported, without importing it."""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+def _is_model_unavailable(e: Exception) -> bool:
+    """Not-found / permission errors: the model will keep failing for this key (unlike quota or transient errors)."""
+    s = str(e).lower()
+    return "not_found" in s or "404" in s or "permission_denied" in s or "403" in s
+
 class GeminiLLM:
     def __init__(self, api_keys: List[str]):
+        # One instance is shared by all sessions (threads), see _shared_llm.
+        self._lock = threading.RLock()
         self.api_keys = [k.strip() for k in api_keys if str(k).strip()]
         self.backend = "none"
         self.model_in_use = ""
         self.last_error = ""
         self._client = None
         self._legacy = None
+        # api key -> model names that returned not-found/permission errors for it
+        self._dead_models: Dict[str, Set[str]] = {}
         self._init_backend()
 
     @staticmethod
     def from_env_or_secrets() -> "GeminiLLM":
+        """Process-cached instance for the current key pool (see _shared_llm)."""
+        keys = GeminiLLM._resolve_api_keys()
+        sig = hashlib.sha256("|".join(keys).encode("utf-8")).hexdigest()
+        return _shared_llm(sig, tuple(keys))
+
+    @staticmethod
+    def _resolve_api_keys() -> List[str]:
         keys: List[str] = []
 
         def pull(name: str) -> Any:
@@ -606,14 +654,40 @@ class GeminiLLM:
             else:
                 keys = [raw.strip()]
 
-        return GeminiLLM(keys)
+        return keys
 
     def _init_backend(self) -> None:
+        with self._lock:
+            self._init_backend_locked()
+
+    def _init_backend_locked(self) -> None:
+        """Pick the backend without importing any SDK; _ensure_backend() imports on first use."""
+        self._client = None
+        self._legacy = None
+        self._backend_ready = False
         if not self.api_keys:
             self.backend = "none"
             self.last_error = "API key yok."
             return
 
+        for backend, module in (("genai", "google.genai"), ("legacy", "google.generativeai")):
+            if _module_available(module):
+                self.backend = backend
+                self.model_in_use = "gemini-2.5-pro"
+                return
+        self.backend = "none"
+        self.last_error = "google-genai / google-generativeai kurulu değil."
+
+    def _ensure_backend(self) -> None:
+        """Import the SDK and build the client once (per key) before the first request."""
+        with self._lock:
+            self._ensure_backend_locked()
+
+    def _ensure_backend_locked(self) -> None:
+        if self._backend_ready or not self.api_keys:
+            return
+        self._backend_ready = True
+
         # Try new SDK: google-genai
         try:
             from google import genai  # type: ignore
@@ -639,16 +713,36 @@ class GeminiLLM:
             self.last_error = f"google-generativeai yok/başarısız: {e}"
 
     def status(self) -> LLMStatus:
-        if self.backend == "none":
-            return LLMStatus(False, "none", "", self.last_error)
-        return LLMStatus(True, self.backend, self.model_in_use, "")
+        with self._lock:
+            if self.backend == "none":
+                return LLMStatus(False, "none", "", self.last_error)
+            return LLMStatus(True, self.backend, self.model_in_use, "")
 
     def _rotate_key(self) -> None:
-        if len(self.api_keys) <= 1:
-            return
-        self.api_keys = self.api_keys[1:] + self.api_keys[:1]
-        # re-init with next key
-        self._init_backend()
+        with self._lock:
+            if len(self.api_keys) <= 1:
+                return
+            self.api_keys = self.api_keys[1:] + self.api_keys[:1]
+            # re-init with next key
+            self._init_backend_locked()
+            self._ensure_backend_locked()
+
+    def _snapshot(self) -> Tuple[str, Any, Any, Set[str]]:
+        """(backend, client, legacy, dead models) for the current key, read together.
+
+        Another session may rotate keys mid-call; requests use the snapshot.
+        """
+        with self._lock:
+            self._ensure_backend_locked()
+            key = self.api_keys[0] if self.api_keys else ""
+            return self.backend, self._client, self._legacy, self._dead_models.setdefault(key, set())
+
+    def _record(self, *, model: str = "", error: str = "") -> None:
+        with self._lock:
+            if model:
+                self.model_in_use = model
+            if error:
+                self.last_error = error
 
     def generate_text(self, prompt: str, temperature: float = 0.8, max_output_tokens: int = 1400) -> str:
         """Generate text with key rotation + model fallback.
@@ -656,26 +750,23 @@ class GeminiLLM:
         - Tries a small list of candidate Gemini model names.
         - Rotates across all provided API keys if an error occurs.
         """
-        candidates = [
-            "gemini-2.5-pro",
-            "gemini-2.5-flash",
-            "gemini-3-flash-preview",
-            "gemini-2.0-flash",
-            "gemini-1.5-flash",
-            "gemini-1.5-pro",
-        ]
+        candidates = _TEXT_MODEL_CANDIDATES
 
         last_err: Optional[Exception] = None
 
         # Try each key (rotate on failure). For each key, try candidate models.
         for _ in range(max(1, len(self.api_keys))):
-            if self.backend == "genai" and self._client is not None:
+            # Models that already failed as unavailable for this key are skipped.
+            backend, client, legacy, dead = self._snapshot()
+            if backend == "genai" and client is not None:
                 for m in candidates:
+                    if m in dead:
+                        continue
                     try:
                         res = None
                         try:
                             # Prefer JSON-safe responses when supported by the installed SDK.
-                            res = self._client.models.generate_content(
+                            res = client.models.generate_content(
                                 model=m,
                                 contents=prompt,
                                 config={
@@ -686,7 +777,7 @@ class GeminiLLM:
                             )
                         except TypeError:
                             # Older SDK versions may not support response_mime_type.
-                            res = self._client.models.generate_content(
+                            res = client.models.generate_content(
                                 model=m,
                                 contents=prompt,
                                 config={
@@ -696,16 +787,21 @@ class GeminiLLM:
                             )
                         txt = getattr(res, "text", "") or ""
                         if txt.strip():
-                            self.model_in_use = m
+                            self._record(model=m)
                             return txt
                     except Exception as e:
                         last_err = e
+                        if _is_model_unavailable(e):
+                            with self._lock:
+                                dead.add(m)
                         continue
 
-            if self.backend == "legacy" and self._legacy is not None:
+            if backend == "legacy" and legacy is not None:
                 for m in candidates:
+                    if m in dead:
+                        continue
                     try:
-                        model = self._legacy.GenerativeModel(m)
+                        model = legacy.GenerativeModel(m)
                         res = None
                         try:
                             res = model.generate_content(
@@ -726,10 +822,13 @@ class GeminiLLM:
                             )
                         txt = getattr(res, "text", "") or ""
                         if txt.strip():
-                            self.model_in_use = m
+                            self._record(model=m)
                             return txt
                     except Exception as e:
                         last_err = e
+                        if _is_model_unavailable(e):
+                            with self._lock:
+                                dead.add(m)
                         continue
 
             # rotate to next key and re-init backend
@@ -744,62 +843,52 @@ class GeminiLLM:
         - With legacy backend: falls back to best-effort parsing + one repair pass.
         Returns (data_or_none, raw_text).
         """
-        # Candidate models (first one is preferred)
-        candidates = [
-            "gemini-2.5-pro",
-            "gemini-2.5-pro-latest",
-            "gemini-2.5-flash",
-            "gemini-2.0-flash",
-            "gemini-1.5-pro",
-        ]
-
-        if self.backend == "genai" and self._client is not None:
+        candidates = _JSON_MODEL_CANDIDATES
+
+        backend, client, _, _ = self._snapshot()
+        if backend == "genai" and client is not None:
             last_err = ""
+            cfg = {"temperature": temperature, "max_output_tokens": max_output_tokens}
+            # Preferred first: structured outputs (JSON mode + schema). Older SDK versions
+            # raise TypeError for response_json_schema / response_mime_type.
+            cfgs = (
+                {**cfg, "response_mime_type": "application/json", "response_json_schema": MONTH_RESPONSE_JSON_SCHEMA},
+                {**cfg, "response_mime_type": "application/json"},
+                cfg,
+            )
+            # Per call: a TypeError only downgrades the remaining attempts of this call.
+            cfg_level = 0
             for model in candidates:
                 # Try with current key; rotate on API errors (quota, auth, etc.)
                 for _ in range(max(1, len(self.api_keys))):
                     try:
-                        cfg = {"temperature": temperature, "max_output_tokens": max_output_tokens}
-                        try:
-                            # Preferred: structured outputs (JSON mode + schema).
-                            cfg2 = dict(cfg)
-                            cfg2.update({
-                                "response_mime_type": "application/json",
-                                "response_json_schema": MONTH_RESPONSE_JSON_SCHEMA,
-                            })
-                            resp = self._client.models.generate_content(
-                                model=model,
-                                contents=prompt,
-                                config=cfg2,
-                            )
-                        except TypeError:
-                            # Older SDK versions may not support response_json_schema / response_mime_type.
+                        # Start from the richest config accepted so far in this call.
+                        for level in range(cfg_level, len(cfgs)):
                             try:
-                                cfg3 = dict(cfg)
-                                cfg3.update({"response_mime_type": "application/json"})
-                                resp = self._client.models.generate_content(
+                                resp = client.models.generate_content(
                                     model=model,
                                     contents=prompt,
-                                    config=cfg3,
+                                    config=cfgs[level],
                                 )
                             except TypeError:
-                                resp = self._client.models.generate_content(
-                                    model=model,
-                                    contents=prompt,
-                                    config=cfg,
-                                )
+                                if level == len(cfgs) - 1:
+                                    raise
+                                continue
+                            cfg_level = level
+                            break
                         raw = (getattr(resp, "text", "") or "").strip()
                         # Should already be valid JSON, but keep a defensive parser.
                         data = try_parse_json(raw) or json.loads(raw)
-                        self.model_in_use = model
+                        self._record(model=model)
                         return data, raw
                     except Exception as e:
                         last_err = str(e)
-                        self.last_error = last_err
+                        self._record(error=last_err)
                         # rotate to next key and re-init backend
                         self._rotate_key()
                         # refresh client if we have keys
-                        if self.backend != "genai":
+                        backend, client, _, _ = self._snapshot()
+                        if backend != "genai" or client is None:
                             break
                         continue
             return None, (last_err or "")
@@ -809,7 +898,7 @@ class GeminiLLM:
         try:
             raw = self.generate_text(prompt, temperature=temperature, max_output_tokens=max_output_tokens)
         except Exception as e:
-            self.last_error = str(e)
+            self._record(error=str(e))
             return None, raw
 
         data = try_parse_json(raw)
@@ -823,11 +912,20 @@ class GeminiLLM:
             if data:
                 return data, repaired
         except Exception as e:
-            self.last_error = str(e)
+            self._record(error=str(e))
 
         return None, raw
 
 
+@st.cache_resource(show_spinner=False)
+def _shared_llm(keys_sig: str, _keys: Tuple[str, ...]) -> GeminiLLM:
+    """Build the client once per process and key pool.
+
+    Streamlit re-runs this script on every interaction; without the cache each
+    rerun would re-import the SDK and construct a new client. Only the signature
+    is hashed, so secrets never appear in the cache key.
+    """
+    return GeminiLLM(list(_keys))
 
 
 
@@ -835,9 +933,10 @@ class GeminiLLM:
 # Game state
 # =========================
 
-DEFAULT_EXPENSES = {"Salarlar": 50_000, "Sunucu": 6_100, "Pazarlama": 5_300}
+# Read-only: sessions get their own dict(DEFAULT_EXPENSES) copy to edit.
+DEFAULT_EXPENSES: Mapping[str, int] = MappingProxyType({"Salarlar": 50_000, "Sunucu": 6_100, "Pazarlama": 5_300})
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Archetype:
     key: str
     title: str
@@ -848,13 +947,15 @@ class Archetype:
     churn: float
     cash_mult: float = 1.0
 
-ARCHETYPES: List[Archetype] = [
+ARCHETYPES: Tuple[Archetype, ...] = (
     Archetype("tech", "Teknik Kurucu", "Altyapı güçlü, ama support hızla büyüyebilir.", 48, 22, 16, 0.050, 1.00),
     Archetype("sales", "Satışçı Kurucu", "Gelir baskın, ama operasyon yükü ve churn riski artabilir.", 52, 25, 22, 0.060, 1.00),
     Archetype("product", "Ürüncü Kurucu", "Kullanıcı deneyimi iyi; dengeli ilerler.", 55, 20, 20, 0.045, 1.00),
     Archetype("ops", "Operasyoncu Kurucu", "Düzen ve verimlilik; büyüme yavaş ama sağlam.", 50, 18, 18, 0.050, 1.05),
     Archetype("finance", "Finansçı Kurucu", "Runway odaklı; risk yönetimi güçlü.", 47, 22, 22, 0.055, 1.10),
-]
+)
+
+_ARCH_BY_KEY: Dict[str, Archetype] = {a.key: a for a in ARCHETYPES}
 
 def default_stats(start_cash: int, archetype: Archetype) -> dict:
     return {
@@ -866,43 +967,53 @@ def default_stats(start_cash: int, archetype: Archetype) -> dict:
         "churn": float(archetype.churn),
     }
 
+# Session defaults, applied once per missing key. Callables are factories, so
+# mutable values (and run_id) are created only when the key is actually missing.
+_DEFAULTS: Dict[str, Any] = {
+    "run_id": now_id,
+    "started": False,
+    "ended": False,
+
+    "month": 1,
+    "season_length": 12,
+
+    "mode": "Gerçekçi",
+    "case_key": "free",
+
+    "founder_name": "İsimsiz Girişimci",
+    "archetype_key": "product",
+    "startup_idea": "",
+
+    "start_cash": 1_000_000,
+    "expenses": lambda: dict(DEFAULT_EXPENSES),
+
+    "history": list,          # list of past month choices
+    "months": dict,           # month -> content bundle
+    "month_sources": dict,    # month -> "gemini" | "offline"
+    "chat": list,             # chat messages
+    "delayed_queue": list,    # list of delayed effects dicts
+
+    "pending_note": "",
+    "pending_reason": "",
+    "locked_settings": dict,  # frozen snapshot when started
+
+    "llm_disabled": False,
+    "llm_fail_count": 0,
+    "llm_last_error": "",
+    "llm_last_raw": "",
+    "llm_last_raw_repaired": "",
+}
+
 def init_state() -> None:
     ss = st.session_state
-    ss.setdefault("run_id", now_id())
-    ss.setdefault("started", False)
-    ss.setdefault("ended", False)
-
-    ss.setdefault("month", 1)
-    ss.setdefault("season_length", 12)
-
-    ss.setdefault("mode", "Gerçekçi")
-    ss.setdefault("case_key", "free")
-
-    ss.setdefault("founder_name", "İsimsiz Girişimci")
-    ss.setdefault("archetype_key", "product")
-    ss.setdefault("startup_idea", "")
+    for k, v in _DEFAULTS.items():
+        if k not in ss:
+            ss[k] = v() if callable(v) else v
 
-    ss.setdefault("start_cash", 1_000_000)
-    ss.setdefault("expenses", DEFAULT_EXPENSES.copy())
-
-    arch = next((a for a in ARCHETYPES if a.key == ss["archetype_key"]), ARCHETYPES[0])
-    ss.setdefault("stats", default_stats(int(ss["start_cash"] * arch.cash_mult), arch))
-
-    ss.setdefault("history", [])          # list of past month choices
-    ss.setdefault("months", {})           # month -> content bundle
-    ss.setdefault("month_sources", {})    # month -> "gemini" | "offline"
-    ss.setdefault("chat", [])             # chat messages
-    ss.setdefault("delayed_queue", [])    # list of delayed effects dicts
-
-    ss.setdefault("pending_note", "")
-    ss.setdefault("pending_reason", "")
-    ss.setdefault("locked_settings", {})  # frozen snapshot when started
-
-    ss.setdefault("llm_disabled", False)
-    ss.setdefault("llm_fail_count", 0)
-    ss.setdefault("llm_last_error", "")
-    ss.setdefault("llm_last_raw", "")
-    ss.setdefault("llm_last_raw_repaired", "")
+    # stats depend on the (possibly just defaulted) start cash and archetype
+    if "stats" not in ss:
+        arch = _ARCH_BY_KEY.get(ss["archetype_key"], ARCHETYPES[0])
+        ss["stats"] = default_stats(int(ss["start_cash"] * arch.cash_mult), arch)
 
 def reset_game(keep_settings: bool = True) -> None:
     ss = st.session_state
@@ -920,7 +1031,7 @@ def reset_game(keep_settings: bool = True) -> None:
             ss[k] = v
 
     # reset stats from archetype & cash
-    arch = next((a for a in ARCHETYPES if a.key == ss["archetype_key"]), ARCHETYPES[0])
+    arch = _ARCH_BY_KEY.get(ss["archetype_key"], ARCHETYPES[0])
     ss["stats"] = default_stats(int(ss["start_cash"] * arch.cash_mult), arch)
 
 def lock_settings() -> None:
@@ -951,11 +1062,11 @@ def get_locked(k: str, default: Any = None) -> Any:
 
 def build_prompt(month: int, mode: str, idea: str, history: List[dict], case: CaseSeason, stats: dict) -> str:
     spec = MODES.get(mode, MODES["Gerçekçi"])
-    tone = spec["tone"]
-    is_turkey = bool(spec.get("turkey"))
-    is_absurd = bool(spec.get("absurd"))
-    deceptive = bool(spec.get("deceptive"))
-    antagonistic = bool(spec.get("antagonistic"))
+    tone = spec.tone
+    is_turkey = bool(spec.turkey)
+    is_absurd = bool(spec.absurd)
+    deceptive = bool(spec.deceptive)
+    antagonistic = bool(spec.antagonistic)
 
     hist_lines = [
         f"- Ay {h.get('month')}: {h.get('choice')} / {h.get('choice_title')} | not: {h.get('note','-')}"
@@ -1271,7 +1382,7 @@ def generate_month_bundle(llm: GeminiLLM, month: int) -> Tuple[dict, str]:
         return offline_month_bundle(month, mode, idea, history, case), "offline"
 
     prompt = build_prompt(month, mode, idea, history, case, stats)
-    temperature = float(MODES.get(mode, MODES["Gerçekçi"])["temp"])
+    temperature = float(MODES.get(mode, MODES["Gerçekçi"]).temp)
 
     try:
         data, raw = llm.generate_month_json(prompt, temperature=temperature, max_output_tokens=2200)
@@ -1352,15 +1463,15 @@ def _sample_delta(tag: str, rng: random.Random, swing: float) -> Dict[str, float
 
 def _mode_adjustments(d: Dict[str, float], rng: random.Random, mode: str) -> Dict[str, float]:
     spec = MODES.get(mode, MODES["Gerçekçi"])
-    if spec.get("antagonistic"):
+    if spec.antagonistic:
         # Spartan: add negative drift
-        d["cash"] -= rng.uniform(10_000, 40_000) * spec["swing"]
-        d["churn"] += rng.uniform(0.002, 0.010) * spec["swing"]
-        d["reputation"] -= rng.uniform(0, 4) * spec["swing"]
+        d["cash"] -= rng.uniform(10_000, 40_000) * spec.swing
+        d["churn"] += rng.uniform(0.002, 0.010) * spec.swing
+        d["reputation"] -= rng.uniform(0, 4) * spec.swing
     if mode == "Zor":
         # Slightly harsher volatility
         if rng.random() < 0.35:
-            d["cash"] -= rng.uniform(5_000, 25_000) * spec["swing"]
+            d["cash"] -= rng.uniform(5_000, 25_000) * spec.swing
     return d
 
 def _case_bias(d: Dict[str, float], tag: str, month: int) -> Dict[str, float]:
@@ -1394,7 +1505,7 @@ def schedule_delayed_effect(month: int, choice: str, tag: str, risk: str, seed_p
     rng = rng_for(month, choice)
 
     p = {"low": 0.35, "med": 0.60, "high": 0.82}[risk]
-    if spec.get("antagonistic"):
+    if spec.antagonistic:
         p = min(0.95, p + 0.10)
     if rng.random() > p:
         return
@@ -1407,7 +1518,7 @@ def schedule_delayed_effect(month: int, choice: str, tag: str, risk: str, seed_p
     if tag == "growth":
         delayed_tag = "reliability" if rng.random() < 0.4 else "growth"
 
-    base = _sample_delta(delayed_tag, rng, swing=0.55 * spec["swing"])
+    base = _sample_delta(delayed_tag, rng, swing=0.55 * spec.swing)
     # Make delayed "lean negative"
     base["cash"] -= abs(base["cash"]) * 0.25
     base["reputation"] -= max(0.0, base["reputation"]) * 0.15
@@ -1485,7 +1596,7 @@ def step_month(choice: str) -> None:
     # Monthly expenses
     total_exp = float(sum(ss["expenses"].values()))
     macro_extra = 0.0
-    if spec.get("turkey"):
+    if spec.turkey:
         macro_extra = turkey_macro_cost(month)
     stats["cash"] = max(0.0, stats["cash"] - total_exp - macro_extra)
 
@@ -1496,7 +1607,7 @@ def step_month(choice: str) -> None:
     seed_phrase = str(choice_obj.get("delayed_seed", "")).strip()
 
     rng = rng_for(month, choice)
-    swing = float(spec["swing"])
+    swing = float(spec.swing)
     delta = _sample_delta(tag, rng, swing=swing)
     delta = _mode_adjustments(delta, rng, mode)
     delta = _case_bias(delta, tag, month)
@@ -1594,10 +1705,10 @@ def render_sidebar(llm: GeminiLLM) -> None:
     st.sidebar.markdown("### Mod")
     if not locked:
         ss["mode"] = st.sidebar.selectbox("Mod", list(MODES.keys()), index=list(MODES.keys()).index(ss["mode"]), label_visibility="collapsed")
-        st.sidebar.caption(MODES[ss["mode"]]["desc"])
+        st.sidebar.caption(MODES[ss["mode"]].desc)
     else:
         st.sidebar.write(f"**{get_locked('mode')}**")
-        st.sidebar.caption(MODES[get_locked('mode')]["desc"])
+        st.sidebar.caption(MODES[get_locked('mode')].desc)
 
     # Case selection
     st.sidebar.markdown("### Vaka sezonu")
@@ -1632,7 +1743,7 @@ def render_sidebar(llm: GeminiLLM) -> None:
     if not locked:
         ss["start_cash"] = int(st.sidebar.slider("Başlangıç kasası", 50_000, 2_000_000, int(ss["start_cash"]), 50_000))
         # live preview of starting stats
-        arch = next((a for a in ARCHETYPES if a.key == ss["archetype_key"]), ARCHETYPES[0])
+        arch = _ARCH_BY_KEY.get(ss["archetype_key"], ARCHETYPES[0])
         ss["stats"] = default_stats(int(ss["start_cash"] * arch.cash_mult), arch)
     else:
         st.sidebar.write(money(get_locked("start_cash", int(stats["cash"]))))
@@ -1648,7 +1759,7 @@ def render_sidebar(llm: GeminiLLM) -> None:
             st.write(f"- {k}: {money(v)}")
             total += v
         st.write(f"**TOPLAM:** {money(total)}")
-        if MODES.get(get_locked("mode", ss["mode"]), {}).get("turkey") and locked:
+        if MODES.get(get_locked("mode", ss["mode"]), MODES["Gerçekçi"]).turkey and locked:
             st.caption("Türkiye modunda her ay ek makro maliyet doğabilir (enflasyon/kur/denetim/afet).")
 
     st.sidebar.markdown("---")
@@ -1702,7 +1813,7 @@ def render_header() -> None:
     with c2:
         ss = st.session_state
         if ss.get("started"):
-            arch = next((a for a in ARCHETYPES if a.key == get_locked("archetype_key", ss["archetype_key"])), ARCHETYPES[0])
+            arch = _ARCH_BY_KEY.get(get_locked("archetype_key", ss["archetype_key"]), ARCHETYPES[0])
             with st.expander("🧑‍💻 Karakter (kilitli)", expanded=False):
                 st.write(f"**{get_locked('founder_name')}** — {arch.title}")
                 st.caption(arch.blurb)
@@ -1734,12 +1845,12 @@ def render_start_screen() -> None:
         placeholder="Örn: KOBİ'ler için otomatik fatura takibi + tahsilat hatırlatma...",
     )
 
-    arch = next((a for a in ARCHETYPES if a.key == ss["archetype_key"]), ARCHETYPES[0])
+    arch = _ARCH_BY_KEY.get(ss["archetype_key"], ARCHETYPES[0])
     st.markdown("### Başlangıç özeti")
     c1, c2, c3 = st.columns(3)
     with c1:
         st.write(f"**Mod:** {ss['mode']}")
-        st.caption(MODES[ss["mode"]]["desc"])
+        st.caption(MODES[ss["mode"]].desc)
     with c2:
         case = get_case(ss["case_key"])
         st.write(f"**Vaka:** {case.title}")
@@ -1770,7 +1881,7 @@ def render_start_screen() -> None:
 
         # lock settings and reset stats based on archetype
         lock_settings()
-        arch2 = next((a for a in ARCHETYPES if a.key == ss["archetype_key"]), ARCHETYPES[0])
+        arch2 = _ARCH_BY_KEY.get(ss["archetype_key"], ARCHETYPES[0])
         ss["stats"] = default_stats(int(ss["start_cash"] * arch2.cash_mult), arch2)
 
         # Opening message
@@ -1868,7 +1979,7 @@ def render_chat_and_choices(llm: GeminiLLM) -> None:
     st.subheader(f"Ay {month}: Kararını ver")
 
     # Optional reason for Zor/Spartan
-    if spec.get("require_reason"):
+    if spec.require_reason:
         ss["pending_reason"] = st.text_area(
             "1–3 cümle: Bu ay neden bu kararı vereceksin? (Zor/Spartan modu)",
             value=ss.get("pending_reason", ""),
@@ -1898,11 +2009,11 @@ def render_chat_and_choices(llm: GeminiLLM) -> None:
                 st.write(f"- {s}")
 
             disabled = False
-            if spec.get("require_reason") and not (ss.get("pending_reason") or "").strip():
+            if spec.require_reason and not (ss.get("pending_reason") or "").strip():
                 disabled = True
 
             if st.button(f"{key} seç", key=f"btn_{month}_{key}", use_container_width=True, disabled=disabled):
-                if spec.get("require_reason") and not (ss.get("pending_reason") or "").strip():
+                if spec.require_reason and not (ss.get("pending_reason") or "").strip():
                     ss["chat"].append({"role":"assistant","kind":"warn","content":"🟨 Bu modda seçim yapmadan önce kısa bir gerekçe yazmalısın."})
                     st.rerun()
                 step_month(key)